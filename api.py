@@ -1,13 +1,27 @@
-# api.py requires packages: fastapi, uvicorn
+# api.py requires packages: fastapi, uvicorn, orjson
+import asyncio
+import hashlib
+import multiprocessing
 import os
-from typing import Union
-from fastapi import FastAPI, Request, Depends
-from fastapi.responses import FileResponse, Response
-from fastapi.middleware.cors import CORSMiddleware
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+from fastapi import FastAPI, Cookie, Depends, Header, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.routing import APIRouter
-from pydantic import BaseModel
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from pydantic import BaseModel, Field
+import orjson
 
 import database
+import utility
 
 tags_metadata: list = [
     {
@@ -22,10 +36,6 @@ tags_metadata: list = [
         "name": "Get",
         "description": "Endpoints for requests.",
     },
-    {
-        "name": "Index",
-        "description": "Endpoint for serving web client.",
-    },
     {
         "name": "Tokens",
         "description": "Endpoint for token addition and deletion.",
@@ -46,25 +56,99 @@ contact = {
         "url": "https://github.com/Stovka/dpv5",
         "email": "petrstovicek1@gmail.com",
     }
-with open("version.txt") as file:
-    version = file.read()
+# Relative to this file, so that application does not depend on working directory
+version: str = pathlib.Path(__file__).parent.joinpath("version.txt").read_text(encoding="ascii").strip()
+
+
+class CORSMiddleware:
+    """Pure ASGI CORS middleware for fully open API (any origin, method and header, credentials allowed).
+    Headers are computed once. Origin is mirrored only when it has to be (cookie or preflight), because browsers
+    reject wildcard origin for credentialed requests.
+    """
+    ALLOW_METHODS: bytes = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+    MAX_AGE: bytes = b"600"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._simple_headers = [(b"access-control-allow-origin", b"*"),
+                                (b"access-control-allow-credentials", b"true")]
+        self._preflight_headers = [(b"access-control-allow-credentials", b"true"),
+                                   (b"access-control-allow-methods", self.ALLOW_METHODS),
+                                   (b"access-control-max-age", self.MAX_AGE),
+                                   (b"vary", b"Origin"),
+                                   (b"content-length", b"0")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        origin = None
+        cookie = False
+        request_method = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"cookie":
+                cookie = True
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+        if origin is None:
+            # Not a CORS request
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            # Preflight request, answer it directly
+            headers = [(b"access-control-allow-origin", origin)] + self._preflight_headers
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if cookie is True:
+            cors_headers = [(b"access-control-allow-origin", origin),
+                            (b"access-control-allow-credentials", b"true"),
+                            (b"vary", b"Origin")]
+        else:
+            cors_headers = self._simple_headers
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# FastAPI ##############################################################################################################
+shutdown_handlers: list[Callable[[], None]] = []  # Registered by setup(), called in order on application shutdown
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    for handler in shutdown_handlers:
+        handler()
+
+
 app = FastAPI(title="Fistop",
               version=version,
               description=description,
               license_info=license_info,
               contact=contact,
-              openapi_tags=tags_metadata)
+              openapi_tags=tags_metadata,
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan)
 api_router = APIRouter()
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Last added middleware is the outermost -> CORS headers are added to already compressed response
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(CORSMiddleware)
 
 # Do not modify! Use settings/config.ini
-db: Union[None, database.DatabaseManager] = None
 ALLOW_HEADER_TOKEN: bool = True
 ALLOW_PARAMETER_TOKEN: bool = True
 ALLOW_COOKIE_TOKEN: bool = True
@@ -72,147 +156,254 @@ ALLOW_WEB_CLIENT: bool = True
 INDEX: str = "web_client/build/index.html"
 STATIC_FILES: str = "web_client/build/"  # Relative path
 STATIC_FILES_ABS: str = os.path.realpath(STATIC_FILES)  # Absolute path
+STATIC_FILES_PREFIX: str = STATIC_FILES_ABS + os.sep  # Every served file must start with this prefix
+INDEX_ABS: str = os.path.realpath(INDEX)
+CONFIG_ENV: str = "FISTOP_CONFIG"  # Environment variable with path to config file (used by app_factory)
+REQUEST_THREADS: int = 40  # Maximum number of concurrently processed service requests (get, get_list endpoints)
+# Request body of get_list endpoint for OpenAPI docs (body is parsed manually)
+LIST_BODY_SCHEMA: dict = {"requestBody": {"required": True, "content": {"application/json": {
+    "schema": {"type": "array", "items": {"type": "string"}}}}}}
 
 
 # API ##################################################################################################################
-def get_token(request: Request, token: str = "") -> str:
+async def get_token(header_token: Optional[str] = Header(None, alias="token"), token: str = "",
+                    cookie_token: Optional[str] = Cookie(None, alias="token")) -> str:
     # Header token
-    if ALLOW_HEADER_TOKEN is True:
-        header_token = request.headers.get("token")
-        if header_token is not None:
-            if header_token != "null":  # Javascript None
-                return header_token
+    if ALLOW_HEADER_TOKEN is True and header_token is not None and header_token != "null":  # "null" Javascript None
+        return header_token
 
     # Parameter token
     if ALLOW_PARAMETER_TOKEN is True and token != "":
         return token
 
     # Cookie token
-    if ALLOW_COOKIE_TOKEN:
-        try:
-            cookie_token = request.cookies["token"]
-            if cookie_token != "null":
-                return cookie_token
-        except KeyError:
-            pass
+    if ALLOW_COOKIE_TOKEN is True and cookie_token is not None and cookie_token != "null":
+        return cookie_token
     # Always return at least empty token
     return ""
 
 
-# GET
-# User/Admin endpoints
-@api_router.get("/server/info/services/", tags=["Info"])
-def info_services(token: str = Depends(get_token)):
-    return db.get_services_info(token)
-
-
-@api_router.get("/server/info/services2/", tags=["Info"])
-def info_services2(token: str = Depends(get_token)):
-    return db.get_services_info_more(token)
-
-
-@api_router.get("/server/info/groups/", tags=["Info"])
-def info_groups(token: str = Depends(get_token)):
-    return db.get_groups_info(token)
-
-
-# Admin endpoints
-@api_router.get("/server/info/tokens/", tags=["Info"])
-def info_tokens(token: str = Depends(get_token)):
-    return db.get_tokens_info(token)
-
-
-@api_router.get("/server/info/server/", tags=["Info"])
-def info_server(token: str = Depends(get_token)):
-    return db.get_server_info(token)
-
-
-@api_router.get("/server/info/version/", tags=["Info"])
-def info_version(token: str = Depends(get_token)):
-    return db.get_server_version(token)
-
-
-@api_router.get("/server/start/", tags=["Commands"])
-def start_services(token: str = Depends(get_token)):
-    return db.get_start(token)
-
+class ResponseCache:
+    """Cache of serialized JSON responses with ETag. Entries expire after ttl seconds. Whole cache should be cleared
+    when tokens or services change."""
+
+    def __init__(self, ttl: float = 10.0, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict = {}  # key -> (expire_time, etag, body)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def response(self, key: tuple, func, if_none_match: Optional[str], on_hit=None) -> Response:
+        """Return cached response for key or create it from output of func(). Returns 304 if ETag matches.
+        on_hit() is called when func() is not (e.g. to keep access log of cached endpoints complete)."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= now:
+            if on_hit is not None:
+                on_hit()
+        else:
+            body = orjson.dumps(func(), option=orjson.OPT_NON_STR_KEYS)
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            if len(self._entries) >= self.max_size:
+                # Remove oldest entry (dict keeps insertion order)
+                del self._entries[next(iter(self._entries))]
+            entry = (now + self.ttl, etag, body)
+            self._entries[key] = entry
+        headers = {"etag": entry[1], "cache-control": "no-cache"}
+        if if_none_match == entry[1]:
+            return Response(status_code=304, headers=headers)
+        return Response(entry[2], media_type="application/json", headers=headers)
 
-@api_router.get("/server/stop/", tags=["Commands"])
-def stop_services(token: str = Depends(get_token)):
-    return db.get_stop(token)
 
-
-@api_router.get("/server/restart/", tags=["Commands"])
-def restart_services(token: str = Depends(get_token)):
-    return db.get_restart(token)
-
-
-@api_router.get("/server/reload_tokens/", tags=["Commands"])
-def reload_tokens(token: str = Depends(get_token)):
-    return db.get_reload_tokens(token)
-
-
-# PUT
 class TokensModel(BaseModel):
     group: str = ""
-    group_services: list = []
+    group_services: list = Field(default_factory=list)
     user: str = ""
-    user_services: list = []
+    user_services: list = Field(default_factory=list)
     superuser: str = ""
     admin: str = ""
 
 
-@api_router.put("/server/tokens/", tags=["Tokens"])
-def put_tokens(data: TokensModel, token: str = Depends(get_token)):
-    return db.put_tokens(data.dict(), token)
-
-
-# DEL
-@api_router.delete("/server/tokens/", tags=["Tokens"])
-def del_tokens(data: TokensModel, token: str = Depends(get_token)):
-    return db.del_tokens(data.dict(), token)
-
-
-# GET
-# User endpoints
-# curl -X GET http://127.0.0.1/api/v1/0/8.8.8.8?token=yourtoken -H "accept: application/json"
-@api_router.get("/{group_service}/{request:path}", tags=["Get"])
-def get(group_service: str, request: str, token: str = Depends(get_token)):
-    # This serves both groups and services IDs, path is here so it accepts slashes
-    return db.get_group(group_service, request, token)
-
-
-# curl -X POST http://127.0.0.1/api/v1/0/?token=yourtoken -H "accept: application/json" -H "Content-Type: application/json" -d "[\"8.8.8.8\",\"8.8.4.4\"]"
-@api_router.post("/{group_service}/", tags=["Get"])
-def get_list(group_service: str, requests: list[str], token: str = Depends(get_token)):
-    # This serves both groups and services IDs
-    return db.get_group_list(group_service, requests, token)
-
-
-app.include_router(api_router, prefix="/api/v1")
-
-
 # Web App ##############################################################################################################
-@app.get("/{request:path}", response_class=FileResponse, tags=["Index"])
-def index(request):
-    if ALLOW_WEB_CLIENT is False:
-        return Response("", status_code=403)
-    file_path = os.path.realpath(STATIC_FILES + request)
-    if os.path.commonpath([STATIC_FILES_ABS, file_path]) != STATIC_FILES_ABS:
-        # Path traversal protection
-        return Response("", status_code=403)
-    if os.path.isfile(file_path):
-        return FileResponse(file_path)
-    return FileResponse(INDEX, media_type="text/html")
-
-
-# FastAPI ##############################################################################################################
-@app.on_event("startup")
-async def startup_event():
-    pass
-
+class WebClientFiles(StaticFiles):
+    """Serves built web client. Unknown paths fall back to index.html so that client side routing works."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._index: Optional[bytes] = None  # Content of index.html, loaded on first fallback
+
+    def lookup_path(self, path: str) -> tuple[str, Optional[os.stat_result]]:
+        # normpath resolves ".." lexically (no syscalls) -> cheap rejection of path traversal
+        file_path = os.path.normpath(os.path.join(STATIC_FILES_ABS, path.lstrip("/")))
+        if not file_path.startswith(STATIC_FILES_PREFIX) and file_path != STATIC_FILES_ABS:
+            # Path traversal protection -> 403 in get_response, must not fall back to index.html
+            raise HTTPException(status_code=403)
+        try:
+            stat_result = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return "", None
+        # Existing path only -> resolve symlinks, they must not point outside of web client directory
+        real_path = os.path.realpath(file_path)
+        if not real_path.startswith(STATIC_FILES_PREFIX) and real_path != STATIC_FILES_ABS:
+            raise HTTPException(status_code=403)
+        return file_path, stat_result
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if ALLOW_WEB_CLIENT is False:
+            return Response("", status_code=403)
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as err:
+            if err.status_code == 403:
+                return Response("", status_code=403)
+            if err.status_code != 404:
+                raise
+        if self._index is None:
+            try:
+                with open(INDEX_ABS, "rb") as file:
+                    self._index = file.read()
+            except FileNotFoundError:
+                # Web client is not built
+                return Response("", status_code=404)
+        return Response(self._index, media_type="text/html", headers={"cache-control": "no-cache"})
+
+
+# Endpoints ############################################################################################################
+def setup(database_manager: database.DatabaseManager) -> None:
+    """Register API endpoints, web client and shutdown handler. Endpoints are closures over database_manager,
+    therefore it is resolved as local (free) variable instead of module global on every request."""
+    db = database_manager
+    info_cache = ResponseCache()  # Info responses per token, cleared by commands which change tokens or services
+    # Service requests wait (block) until services respond. They have own threads so that they cannot exhaust
+    # threadpool used by other endpoints and by the framework itself.
+    request_executor = ThreadPoolExecutor(max_workers=REQUEST_THREADS, thread_name_prefix="request")
+
+    # In-memory lookups run directly in the event loop, blocking calls (services, mp state, tokens file) in threadpool
+    # GET
+    # User/Admin endpoints
+    @api_router.get("/server/info/services/", tags=["Info"])
+    async def info_services(token: str = Depends(get_token),
+                            if_none_match: Optional[str] = Header(None, include_in_schema=False)):
+        return info_cache.response(("services", token), lambda: db.get_services_info(token), if_none_match,
+                                   lambda: db.log_cached_info(token, "get_services_info"))
+
+    @api_router.get("/server/info/services2/", tags=["Info"])
+    async def info_services2(token: str = Depends(get_token),
+                             if_none_match: Optional[str] = Header(None, include_in_schema=False)):
+        return info_cache.response(("services2", token), lambda: db.get_services_info_more(token), if_none_match,
+                                   lambda: db.log_cached_info(token, "get_services_info_more"))
+
+    @api_router.get("/server/info/groups/", tags=["Info"])
+    async def info_groups(token: str = Depends(get_token),
+                          if_none_match: Optional[str] = Header(None, include_in_schema=False)):
+        return info_cache.response(("groups", token), lambda: db.get_groups_info(token), if_none_match,
+                                   lambda: db.log_cached_info(token, "get_groups_info"))
+
+    # Admin endpoints
+    @api_router.get("/server/info/tokens/", tags=["Info"])
+    async def info_tokens(token: str = Depends(get_token)):
+        return db.get_tokens_info(token)
+
+    @api_router.get("/server/info/server/", tags=["Info"])
+    async def info_server(token: str = Depends(get_token)):
+        return await run_in_threadpool(db.get_server_info, token)
+
+    @api_router.get("/server/info/version/", tags=["Info"])
+    async def info_version(token: str = Depends(get_token),
+                           if_none_match: Optional[str] = Header(None, include_in_schema=False)):
+        return info_cache.response(("version", token), lambda: db.get_server_version(token), if_none_match,
+                                   lambda: db.log_cached_info(token, "get_server_version"))
+
+    @api_router.get("/server/start/", tags=["Commands"])
+    async def start_services(token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.get_start, token)
+        info_cache.clear()
+        return output
+
+    @api_router.get("/server/stop/", tags=["Commands"])
+    async def stop_services(token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.get_stop, token)
+        info_cache.clear()
+        return output
+
+    @api_router.get("/server/restart/", tags=["Commands"])
+    async def restart_services(token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.get_restart, token)
+        info_cache.clear()
+        return output
+
+    @api_router.get("/server/reload_tokens/", tags=["Commands"])
+    async def reload_tokens(token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.get_reload_tokens, token)
+        info_cache.clear()
+        return output
+
+    # PUT
+    @api_router.put("/server/tokens/", tags=["Tokens"])
+    async def put_tokens(data: TokensModel, token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.put_tokens, data.model_dump(exclude_unset=True), token)
+        info_cache.clear()
+        return output
+
+    # DEL
+    @api_router.delete("/server/tokens/", tags=["Tokens"])
+    async def del_tokens(data: TokensModel, token: str = Depends(get_token)):
+        output = await run_in_threadpool(db.del_tokens, data.model_dump(exclude_unset=True), token)
+        info_cache.clear()
+        return output
+
+    # GET
+    # User endpoints
+    # curl -X GET http://127.0.0.1/api/v1/0/8.8.8.8?token=yourtoken -H "accept: application/json"
+    @api_router.get("/{group_service}/{request:path}", tags=["Get"])
+    async def get(group_service: str, request: str, token: str = Depends(get_token)):
+        # This serves both groups and services IDs, path is here so it accepts slashes
+        return await asyncio.get_running_loop().run_in_executor(
+            request_executor, db.get_group, group_service, request, token)
+
+    # curl -X POST http://127.0.0.1/api/v1/0/?token=yourtoken -H "accept: application/json" -H "Content-Type: application/json" -d "[\"8.8.8.8\",\"8.8.4.4\"]"
+    @api_router.post("/{group_service}/", tags=["Get"], openapi_extra=LIST_BODY_SCHEMA)
+    async def get_list(group_service: str, request: Request, token: str = Depends(get_token)):
+        # This serves both groups and services IDs
+        # Body is parsed by orjson directly, pydantic validation of every request string is not needed
+        try:
+            requests = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            requests = None
+        if not isinstance(requests, list) or not all(isinstance(req, str) for req in requests):
+            return ORJSONResponse({"detail": "Request body must be JSON list of strings"}, status_code=400)
+        return await asyncio.get_running_loop().run_in_executor(
+            request_executor, db.get_group_list, group_service, requests, token)
+
+    app.include_router(api_router, prefix="/api/v1")
+    # Mounted as last so that API routes take precedence, directory is checked on request (web client may not be built)
+    app.mount("/", WebClientFiles(directory=STATIC_FILES, html=True, check_dir=False), name="web_client")
+    shutdown_handlers.append(db.shutdown)
+    shutdown_handlers.append(lambda: request_executor.shutdown(wait=False))
+
+
+def configure(config: utility.Config) -> None:
+    """Apply API related config items (token sources, web client)."""
+    global ALLOW_HEADER_TOKEN, ALLOW_PARAMETER_TOKEN, ALLOW_COOKIE_TOKEN, ALLOW_WEB_CLIENT
+    ALLOW_HEADER_TOKEN = config.allow_header_token
+    ALLOW_PARAMETER_TOKEN = config.allow_parameter_token
+    ALLOW_COOKIE_TOKEN = config.allow_cookie_token
+    ALLOW_WEB_CLIENT = config.serve_web_client
+
+
+def app_factory() -> FastAPI:
+    """Application factory for multiple uvicorn workers (uvicorn api:app_factory --factory --workers N).
+    Every worker process loads config from path in environment variable FISTOP_CONFIG (default settings/config.ini)
+    and creates its own DatabaseManager with own services, cache and tokens.
+    """
+    # Uvicorn starts workers with spawn start method which is then inherited by service processes,
+    # restore Linux default (fork) same as when fistop.py runs single process
+    if sys.platform.startswith("linux"):
+        multiprocessing.set_start_method("fork", force=True)
+    config = utility.Config(file_config=os.path.normpath(os.environ.get(CONFIG_ENV, "settings/config.ini")))
+    configure(config)
+    setup(database.DatabaseManager(config))
+    return app
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    global db
-    db.shutdown()
@@ -1,9 +1,14 @@
 # client.py requires Python3.9 standard library
 import argparse
 import getpass
+import gzip
+import http.client
+import io
 import json
-import urllib.request
+import queue
+import urllib.error
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import Union
 
@@ -26,20 +31,26 @@ class Client:
     def __init__(self, url: str = DEFAULT_API, token: str = DEFAULT_TOKEN):
         self.base_url = self._validate_url(url)
         self.token = token
+        split_url = urllib.parse.urlsplit(self.base_url)
+        self._scheme = split_url.scheme
+        self._host = split_url.hostname
+        self._port = split_url.port
+        self._conn = None  # Persistent (keep-alive) connection, created on first request
         self._api_prefix = "/api/v1/"
-        self._api_url = self.urljoin(self.base_url, self._api_prefix)
-        self._info_services = self.urljoin(self._api_url, "/server/info/services/")
-        self._info_services2 = self.urljoin(self._api_url, "/server/info/services2/")
-        self._info_groups = self.urljoin(self._api_url, "/server/info/groups/")
-        self._info_tokens = self.urljoin(self._api_url, "/server/info/tokens/")
-        self._info_server = self.urljoin(self._api_url, "/server/info/server/")
-        self._info_version = self.urljoin(self._api_url, "/server/info/version/")
-        self._server_start = self.urljoin(self._api_url, "/server/start/")
-        self._server_stop = self.urljoin(self._api_url, "/server/stop/")
-        self._server_restart = self.urljoin(self._api_url, "/server/restart/")
-        self._server_reload_tokens = self.urljoin(self._api_url, "/server/reload_tokens/")
-        self._put_tokens = self.urljoin(self._api_url, "/server/tokens/")
-        self._del_tokens = self.urljoin(self._api_url, "/server/tokens/")
+        # Endpoints are paths (API may be served under path prefix e.g. https://address.api/fistop/)
+        self._api_url = f"{split_url.path.rstrip('/')}{self._api_prefix}"
+        self._info_services = f"{self._api_url}server/info/services/"
+        self._info_services2 = f"{self._api_url}server/info/services2/"
+        self._info_groups = f"{self._api_url}server/info/groups/"
+        self._info_tokens = f"{self._api_url}server/info/tokens/"
+        self._info_server = f"{self._api_url}server/info/server/"
+        self._info_version = f"{self._api_url}server/info/version/"
+        self._server_start = f"{self._api_url}server/start/"
+        self._server_stop = f"{self._api_url}server/stop/"
+        self._server_restart = f"{self._api_url}server/restart/"
+        self._server_reload_tokens = f"{self._api_url}server/reload_tokens/"
+        self._put_tokens = f"{self._api_url}server/tokens/"
+        self._del_tokens = f"{self._api_url}server/tokens/"
 
     @staticmethod
     def _validate_url(url: str) -> str:
@@ -52,80 +63,89 @@ class Client:
             url = url.replace("localhost", "127.0.0.1")
         return url
 
-    @staticmethod
-    def urljoin(*parts: str):
-        new_url = ""
-        for part in parts:
-            new_url = new_url.strip("/")
-            new_url += "/"+part.lstrip("/")  # Not stripping right
-        return new_url
-
-    def _get_api(self, url: str) -> dict:
-        req = urllib.request.Request(url, method="GET")
-        req.add_header("token", self.token)
-        resp = urllib.request.urlopen(req).read().decode("utf-8")
-        return json.loads(resp)
-
-    def _post_api(self, url: str, data: list) -> dict:
-        req = urllib.request.Request(url, method="POST", data=json.dumps(data).encode())
-        req.add_header("token", self.token)
-        req.add_header("Content-Type", "application/json")
-        resp = urllib.request.urlopen(req).read().decode("utf-8")
-        return json.loads(resp)
-
-    def _put_api(self, url: str, data: dict) -> dict:
-        req = urllib.request.Request(url, method="PUT", data=json.dumps(data).encode())
-        req.add_header("token", self.token)
-        req.add_header("Content-Type", "application/json")
-        resp = urllib.request.urlopen(req).read().decode("utf-8")
-        return json.loads(resp)
-
-    def _del_api(self, url: str, data: dict) -> dict:
-        req = urllib.request.Request(url, method="DELETE", data=json.dumps(data).encode())
-        req.add_header("token", self.token)
-        req.add_header("Content-Type", "application/json")
-        resp = urllib.request.urlopen(req).read().decode("utf-8")
-        return json.loads(resp)
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port)
+        return http.client.HTTPConnection(self._host, self._port)
+
+    def close(self) -> None:
+        """Close persistent connection to the API."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _api(self, method: str, path: str, data: Union[dict, list, None] = None) -> dict:
+        headers = {"token": self.token, "Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        body = None
+        if data is not None:
+            body = json.dumps(data).encode()
+            headers["Content-Type"] = "application/json"
+        # Server may close idle keep-alive connection at any time -> retry once with new connection
+        for attempt in range(2):
+            reused = self._conn is not None
+            if not reused:
+                self._conn = self._connect()
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                resp = self._conn.getresponse()
+                resp_data = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if not reused or attempt == 1:
+                    # Only stale keep-alive connection is retried
+                    raise
+            except BaseException:
+                # Half used connection cannot send another request -> drop it
+                self.close()
+                raise
+        if resp.will_close:
+            self.close()
+        if resp.getheader("Content-Encoding") == "gzip":
+            resp_data = gzip.decompress(resp_data)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(path, resp.status, resp.reason, resp.headers, io.BytesIO(resp_data))
+        return json.loads(resp_data.decode("utf-8"))
 
     def get_services_info(self) -> dict:
         """Returns available services."""
-        return self._get_api(self._info_services)
+        return self._api("GET", self._info_services)
 
     def get_services_info_more(self) -> dict:
         """Returns available services with additional info."""
-        return self._get_api(self._info_services2)
+        return self._api("GET", self._info_services2)
 
     def get_groups_info(self) -> dict:
         """Returns available groups."""
-        return self._get_api(self._info_groups)
+        return self._api("GET", self._info_groups)
 
     def get_tokens_info(self) -> dict:
         """Returns tokens."""
-        return self._get_api(self._info_tokens)
+        return self._api("GET", self._info_tokens)
 
     def get_server_info(self) -> dict:
         """Returns running and static info about server."""
-        return self._get_api(self._info_server)
+        return self._api("GET", self._info_server)
 
     def get_version(self) -> dict:
         """Returns version of API."""
-        return self._get_api(self._info_version)
+        return self._api("GET", self._info_version)
 
     def get_server_start(self) -> dict:
         """Start not running services. Returns status code."""
-        return self._get_api(self._server_start)
+        return self._api("GET", self._server_start)
 
     def get_server_stop(self) -> dict:
         """Stop all running services. Returns status code."""
-        return self._get_api(self._server_stop)
+        return self._api("GET", self._server_stop)
 
     def get_server_restart(self) -> dict:
         """Restart all services. Returns status code."""
-        return self._get_api(self._server_restart)
+        return self._api("GET", self._server_restart)
 
     def get_server_reload_tokens(self) -> dict:
         """Reload tokens from file. Returns status code."""
-        return self._get_api(self._server_reload_tokens)
+        return self._api("GET", self._server_reload_tokens)
 
     def put_tokens(self, tokens: Tokens) -> dict:
         """Add or update from tokens. Tokens must follow structure of dataclass Tokens.
@@ -136,7 +156,7 @@ class Client:
         Returns:
             (dict): Dictionary with status
         """
-        return self._put_api(self._put_tokens, asdict(tokens))
+        return self._api("PUT", self._put_tokens, asdict(tokens))
 
     def del_tokens(self, tokens: Tokens) -> dict:
         """Delete from tokens. Tokens must follow structure of dataclass Tokens.
@@ -147,7 +167,7 @@ class Client:
         Returns:
             (dict): Dictionary with status
         """
-        return self._del_api(self._del_tokens, asdict(tokens))
+        return self._api("DELETE", self._del_tokens, asdict(tokens))
 
     def get(self, service_id_group_name: Union[int, str], request: str) -> dict:
         """Get result for single request.
@@ -159,10 +179,8 @@ class Client:
         Returns:
             (dict): Dictionary with result.
         """
-        request_url = self.urljoin(self._api_url,
-                                   urllib.parse.quote(str(service_id_group_name)),
-                                   urllib.parse.quote(request))
-        return self._get_api(request_url)
+        request_url = f"{self._api_url}{urllib.parse.quote(str(service_id_group_name))}/{urllib.parse.quote(request)}"
+        return self._api("GET", request_url)
 
     def get_list(self, service_id_group_name: Union[int, str], requests: list[str]) -> dict:
         """Get results for multiple requests.
@@ -174,8 +192,79 @@ class Client:
         Returns:
             (dict): Dictionary with results.
         """
-        request_url = self.urljoin(self._api_url, urllib.parse.quote(str(service_id_group_name)), "/")
-        return self._post_api(request_url, requests)
+        request_url = f"{self._api_url}{urllib.parse.quote(str(service_id_group_name))}/"
+        return self._api("POST", request_url, requests)
+
+    def get_list_parallel(self, service_id_group_name: Union[int, str], requests: list[str],
+                          chunk_size: int = 32, max_workers: int = 8) -> dict:
+        """Get results for multiple requests. Requests are split into chunks which are sent concurrently, every
+        worker has its own connection. Results are merged into the same structure as get_list returns.
+
+        Args:
+            service_id_group_name (int | str): Service ID or group name that should be executed.
+            requests (list[str]): List of string requests.
+            chunk_size (int): Maximum number of requests in one POST.
+            max_workers (int): Maximum number of concurrent POSTs (connections).
+
+        Returns:
+            (dict): Dictionary with results. If a chunk fails as a whole, server state is "ERROR" and service lists
+            contain results of the chunks before it only.
+        """
+        if chunk_size < 1 or max_workers < 1:
+            raise Exception(f"Invalid chunk_size: {chunk_size} or max_workers: {max_workers}")
+        chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+        if len(chunks) <= 1:
+            return self.get_list(service_id_group_name, requests)
+
+        # First chunk is sent alone -> invalid group or permissions fail once, before fanning out
+        first = self.get_list(service_id_group_name, chunks[0])
+        if len(first) == 1:
+            # Only "server" key -> whole request failed (invalid group, permissions, validation)
+            output = {"server": dict(first["server"])}
+            output["server"]["input"] = requests
+            return output
+
+        # Pool of clients (connections), each chunk borrows one client
+        clients = queue.Queue()
+        for _ in range(min(max_workers, len(chunks) - 1)):
+            clients.put(Client(self.base_url, self.token))
+
+        def run_chunk(chunk: list[str]) -> dict:
+            client = clients.get()
+            try:
+                return client.get_list(service_id_group_name, chunk)
+            except BaseException:
+                # Do not hand out failed connection to the next chunk
+                client.close()
+                raise
+            finally:
+                clients.put(client)
+
+        try:
+            with ThreadPoolExecutor(max_workers=clients.qsize()) as executor:
+                results = [first] + list(executor.map(run_chunk, chunks[1:]))
+        finally:
+            while not clients.empty():
+                clients.get().close()
+
+        # Merge chunk results, order of requests is preserved
+        output = {"server": dict(first["server"])}
+        output["server"]["input"] = requests
+        for result in results:
+            if len(result) == 1:
+                # Chunk failed as a whole (e.g. validation) -> service lists contain only results of previous chunks
+                output["server"]["state"] = "ERROR"
+                output["server"]["message"] = result["server"].get("message", "")
+                break
+            if result["server"].get("state") == "ERROR":
+                output["server"]["state"] = "ERROR"
+                output["server"]["message"] = result["server"].get("message", "")
+            if "response" in result["server"]:
+                output["server"]["response"] = max(output["server"].get("response", 0), result["server"]["response"])
+            for key, value in result.items():
+                if key != "server":
+                    output.setdefault(key, []).extend(value)
+        return output
 
 
 def main():
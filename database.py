@@ -1,6 +1,4 @@
 # database.py requires Python3.9 standard library
-import ctypes
-import datetime
 import os
 import queue
 import re
@@ -11,6 +9,8 @@ except ModuleNotFoundError as err:
     print("Are you using Python version >3.9? You can check by running command python3")
     raise err
 import collections
+import datetime
+import functools
 import sys
 import threading as th
 import time
@@ -21,8 +21,29 @@ import manager
 
 # Do not modify! Use settings/config.ini
 GET_TIMEOUT: float = 0.01
-GET_ITER: int = 200
+GET_TIMEOUT_MAX: float = 0.5  # Wait timeout of API request grows from GET_TIMEOUT up to GET_TIMEOUT_MAX
+GET_CHECK_INTERVAL: float = 2.0  # Seconds between checks whether request is still pending
 TMP_ITER: int = 20
+TMP_MAX_AGE: int = 20  # Unclaimed tmp result is moved to database after it was scanned TMP_MAX_AGE times
+VERSION_REGEX: re.Pattern = re.compile(r"v?([0-9]{1,6}\.){1,5}[0-9]{1,5}[a-zA-Z]{0,5}")  # Matched by fullmatch
+
+
+def config_endpoint(name: str):
+    """Decorator of API Admin configuration endpoints of DatabaseManager. Checks that token is admin token and that
+    configuration via API is not disabled before calling the endpoint. Token is the last argument of the endpoint."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            token = kwargs["token"] if "token" in kwargs else args[-1]
+            if not self.aman.authorize_admin(token):
+                self.logger.info(f"{token}: {name}: Insufficient permissions")
+                return {"server": "Insufficient permissions"}
+            if self.config.disable_config_endpoints:
+                self.logger.warning(f"{token}: {name}: Configuration via API is disabled")
+                return {"server": "Configuration via API is disabled"}
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
 class DatabaseManager:
@@ -30,17 +51,18 @@ class DatabaseManager:
     def __init__(self, config: Optional[utility.Config] = None, tokens: Optional[dict] = None):
         # Initialize Config
         if isinstance(config, utility.Config):
-            if config.validate() is False:
+            if not config.validate():
                 raise utility.ConfigError("Config: Invalid config")
             self.config = config  # Custom config
         else:
             self.config = utility.Config()  # Default config
+        self.tokens_path = os.path.normpath(self.config.tokens_path)
         # Add included directories into paths
         for directory in self.config.include_dirs:
             if not os.path.exists(os.path.normpath(directory)):
                 raise utility.ConfigError(f"Config: Include directory: {directory} does not exit")
             sys.path.insert(0, os.path.normpath(directory))
-        self.version = self._load_version("version.txt")
+        self.version = self._load_version(os.path.join(os.path.dirname(os.path.abspath(__file__)), "version.txt"))
         # Initialize AuthManager
         # There is no try-catch because app must not start with invalid AuthManager
         if tokens:
@@ -49,7 +71,7 @@ class DatabaseManager:
                                             bypass_user=self.config.bypass_user_auth,
                                             bypass_admin=self.config.bypass_admin_auth)
         else:
-            self.aman = utility.AuthManager(file_tokens=os.path.normpath(self.config.tokens_path),
+            self.aman = utility.AuthManager(file_tokens=self.tokens_path,
                                             token_regex=self.config.token_regex,
                                             bypass_user=self.config.bypass_user_auth,
                                             bypass_admin=self.config.bypass_admin_auth)
@@ -70,7 +92,7 @@ class DatabaseManager:
         self.man = manager.ServiceManager(self.config, self.logger)
         # Check if there are any users/superusers
         if self.aman.get_len_users() == 0 and self.aman.get_len_superusers() == 0:
-            if self.config.bypass_user_auth is False:
+            if not self.config.bypass_user_auth:
                 # bypass_user_auth is False -> not possible to authenticate
                 self.logger.stop_mp_logging()
                 raise utility.ConfigError("Config: There are no users nor superusers and bypass_user_auth is False. "
@@ -79,15 +101,20 @@ class DatabaseManager:
                 self.logger.info("DatabaseManager: There are no users nor superusers but bypass_user_auth is True. "
                                  "Continuing")
         # List of services. This does not store actual instances just srv_id a srv_name
+        # ServiceManager assigns srv_id as position in this list, per-service lists below are indexed by srv_id
         self.services = self.man.get_services()  # [(srv1_id, srv1_name), ...]
+        self.service_map = {srv[0]: srv for srv in self.services}  # {srv1_id: (srv1_id, srv1_name), ...}
+        self.service_ids = frozenset(self.service_map)
         self.service_outputs = [collections.OrderedDict() for _ in self.services]
         self.tmp_results = []
         self.service_output_queues = []
         self.service_input_queues = []
         self.running = False
         self.request_dicts = []  # List of dicts
-        self.garbage_queue = queue.Queue()
+        self.result_events = []  # List of dicts {request ID: threading.Event of waiting API request}
+        self.garbage_queue = queue.SimpleQueue()  # In-process only, no task tracking needed
         self.gb_collector = None
+        self.collectors = []  # Result collector thread for every service
         self.initialized = False
         self.initialize()
         self.start_services()
@@ -96,35 +123,38 @@ class DatabaseManager:
         """Initialize ServiceManager with services, start logger, gb_collector. It normally should not be called because
         it is called automatically when initializing DatabaseManager class. It can be called after shutdown to
         reinitialize again."""
-        if self.initialized is True:
+        if self.initialized:
             self.logger.error(f"ServiceManager: Already initialized")
             return
-        if self.running is True:
+        if self.running:
             # Should never happen
             self.logger.error(f"ServiceManager: Cannot initialize when running.")
             return
-        if self.logger.is_running() is False:
+        if not self.logger.is_running():
             self.logger.start_mp_logging()
 
         self.tmp_results = []
         self.service_input_queues = []
-        self.service_input_queues = []
+        self.service_output_queues = []
         self.request_dicts = []
+        self.result_events = []
         for srv in self.services:
             self.service_input_queues.append(self.man.get_service_input_queue(srv[0]))
             self.service_output_queues.append(self.man.get_service_output_queue(srv[0]))
-            self.tmp_results.append(queue.Queue())
+            self.tmp_results.append(collections.deque())
             self.request_dicts.append({})
+            self.result_events.append({})
 
         self.initialized = True
         self._start_gb_collector()
+        self._start_collectors()
         self.logger.debug("DatabaseManager: initialized")
 
     def start_services(self) -> bool:
         """Start all services. Creates new input/output queues old ones will not exists anymore."""
-        if self.running is True:
+        if self.running:
             return False
-        if self.initialized is False:
+        if not self.initialized:
             return False
         self.man.start()
         self.running = True
@@ -133,7 +163,7 @@ class DatabaseManager:
 
     def stop_services(self) -> bool:
         """Stop all running services. Does not clear database. If you want to exit use shutdown."""
-        if self.running is False:
+        if not self.running:
             return False
         self.running = False
         self.man.stop()
@@ -149,149 +179,196 @@ class DatabaseManager:
         possible nevertheless you can reinitialize app by calling initialize(). """
         self.running = False
         self.initialized = False
+        self._stop_collectors()
         self.man.shutdown()
         self.logger.stop_mp_logging()
         self._stop_gb_collector()
         self._clear_database()
         self.logger.debug("DatabaseManager: Shutdown complete")
+        self.logger.stop()  # Write remaining records
         return True
 
     @staticmethod
     def _load_version(path: str) -> str:
-        version_regex = "^v{0,1}([0-9]{1,6}.){1,5}[0-9]{1,5}[a-zA-Z]{0,5}$"
         with open(path) as f:
             version = f.read().strip()
-        if bool(re.search(version_regex, version)) is False:
+        if VERSION_REGEX.fullmatch(version) is None:
             raise utility.ConfigError(f"Config: Invalid version file: {path}")
         return version
 
     def _clear_database(self) -> None:
         """Create new service databases/Remove all cached results."""
+        # OrderedDict, not dict: evicting the oldest item of a full dict (del d[next(iter(d))]) has to skip deleted
+        # entries at the front which makes it many times slower than OrderedDict.popitem(last=False)
         self.service_outputs = [collections.OrderedDict() for _ in self.services]
 
     def _get_database_result(self, srv_id: int, request: str) -> Union[dict, None]:
         """Get result for a request from service database. It will pop the result if it is too old."""
-        result = self.service_outputs[srv_id].get(request)
-        if not result:
+        entry = self.service_outputs[srv_id].get(request)
+        if not entry:
             return None
-        if (datetime.datetime.now() - result["timestamp"]).total_seconds() > self.config.max_result_age:
+        if time.monotonic() - entry[0] > self.config.max_result_age:
             self.service_outputs[srv_id].pop(request)
-            self.logger.debug(f"DatabaseManager: Removing old result from database for request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"DatabaseManager: Removing old result from database for request: {request}")
             return None
         self.service_outputs[srv_id].move_to_end(request)
-        self.logger.debug(f"DatabaseManager: Result for request: {request}, service_id: {srv_id} found in database.")
-        return result
-
-    def _get_result(self, srv_id: int, request_id: int, request: Union[str, list[str]]) \
-            -> Union[dict, list[dict], None]:
-        """Get result for a request from service output queue. Before result is returned it is saved to the database.
-        If different result was found than it is placed to tmp queue. (Collision between threads)"""
-        result = self.man.get_service_result(srv_id, timeout=GET_TIMEOUT)
-        if result is None:
-            return None
-        if result[0] == request_id:
-            self.logger.debug(f"DatabaseManager: Result for request_id: {request_id}, "
-                              f"service_id: {srv_id} found in ServiceManager.")
-            if isinstance(result[1], list):
-                outputs = []
-                for request, output in zip(request, result[1]):
-                    outputs.append(self._save_result(srv_id, request, output))
-                return outputs
-            else:
-                return self._save_result(srv_id, request, result[1])
-        else:
-            self._save_tmp_result(srv_id, result)
-            return None
-
-    def _get_result_no_wait(self, srv_id: int, request_id, request: Union[str, list[str]]) \
-            -> Union[dict, list[dict], None]:
-        """Get result for a request from service output queue. Same as _get_result but it is non blocking."""
-        result = self.man.get_service_result_nowait(srv_id)
-        if result is None:
-            return None
-
-        if result[0] == request_id:
-            self.logger.debug(f"DatabaseManager: Result for request_id: {request_id}, "
-                              f"service_id: {srv_id} found in ServiceManager.")
-            if isinstance(result[1], list):
-                outputs = []
-                for request, output in zip(request, result[1]):
-                    outputs.append(self._save_result(srv_id, request, output))
-                return outputs
+        if self.logger.debug_enabled:
+            self.logger.debug(f"DatabaseManager: Result for request: {request}, "
+                              f"service_id: {srv_id} found in database.")
+        return entry[1]
+
+    def _get_database_results(self, srv_id: int, requests: list[str]) -> list[Union[dict, None]]:
+        """Get results for list of requests from service database (None for missing). Same as _get_database_result
+        but database, current time and max_result_age are looked up only once for the whole list."""
+        database = self.service_outputs[srv_id]
+        min_timestamp = time.monotonic() - self.config.max_result_age
+        results = []
+        for request in requests:
+            entry = database.get(request)
+            if not entry:
+                results.append(None)
+            elif entry[0] < min_timestamp:
+                database.pop(request, None)
+                results.append(None)
             else:
-                return self._save_result(srv_id, request, result[1])
-        else:
+                database.move_to_end(request)
+                results.append(entry[1])
+        if self.logger.debug_enabled:
+            self.logger.debug(f"DatabaseManager: {sum(r is not None for r in results)} of {len(requests)} results "
+                              f"for service_id: {srv_id} found in database.")
+        return results
+
+    def _collector(self, srv_id: int) -> None:
+        """Thread for collecting results of a service. Moves results from service output queue to tmp queue and wakes
+        up API request waiting for the result, so waiting requests do not have to poll service output queue."""
+        self.logger.debug(f"DatabaseManager: Collector (srv_id: {srv_id}): started")
+        while self.initialized:
+            result = self.man.get_service_result(srv_id, timeout=self.config.th_proc_response_time)
+            if result is None:
+                # None is also a signal to check initialized value
+                continue
             self._save_tmp_result(srv_id, result)
-            return None
+            event = self.result_events[srv_id].get(result[0])
+            if event is not None:
+                event.set()
+        self.logger.debug(f"DatabaseManager: Collector (srv_id: {srv_id}): died")
+
+    def _start_collectors(self) -> None:
+        """Start result collector thread for every service."""
+        self.collectors = []
+        for srv in self.services:
+            collector = th.Thread(target=self._collector, args=(srv[0],), daemon=True, name=f"db_collector_{srv[0]}")
+            collector.start()
+            self.collectors.append(collector)
+
+    def _stop_collectors(self) -> None:
+        """Stop result collector threads. initialized has to be False."""
+        for output_queue in self.service_output_queues:
+            output_queue.put(None)
+        for collector in self.collectors:
+            collector.join(self.config.th_proc_response_time * 2)
+            if collector.is_alive():
+                self.logger.warning(f"DatabaseManager: Collector {collector.name} did not stop")
+        self.collectors = []
 
     def _get_tmp_result(self, srv_id: int, request_id: int, request: Union[str, list[str]]) \
             -> Union[dict, list[dict], None]:
         """Get result for a request from service tmp queue. Before result is returned it is saved to the database."""
         tmp_q = self.tmp_results[srv_id]
-        # tmp_q structure = ((iter_count, (req_id, output)), (iter_count, (req_id, output)), ...)
+        if not tmp_q:
+            # Common case, nothing collected yet
+            return None
+        # tmp_q structure = ([iter_count, req_id, output], [iter_count, req_id, output], ...)
         tmp_result_list = []
         outputs = []
+        # Locals for the loop
+        result_events = self.result_events[srv_id]
+        request_dict = self.request_dicts[srv_id]
+        save_result = self._save_result
         # Get up to TMP_ITER results
         for _ in range(TMP_ITER):
             try:
-                tmp_result = tmp_q.get_nowait()
-                # tmp_result = (iter_count, (req_id, output))
-            except queue.Empty:
+                tmp_result = tmp_q.popleft()
+                # tmp_result = [iter_count, req_id, output]
+            except IndexError:
                 break
-            tmp_result[0] += 1
-            if tmp_result[0] >= 20:
+            if tmp_result[1] not in result_events:
+                # Nobody waits for this result anymore (e.g. request got cached result) -> age it
+                tmp_result[0] += 1
+            if tmp_result[0] >= TMP_MAX_AGE:
                 try:
-                    req = self.request_dicts[srv_id][tmp_result[1][0]]
+                    req = request_dict[tmp_result[1]]
                     if isinstance(req, list):
-                        for sub_req, out in zip(req, tmp_result[1][1]):
-                            self._save_result(srv_id, sub_req, out)
+                        for sub_req, out in zip(req, tmp_result[2]):
+                            save_result(srv_id, sub_req, out)
                     else:
-                        self._save_result(srv_id, req, tmp_result[1][1])
+                        save_result(srv_id, req, tmp_result[2])
                 except KeyError:
                     # This can sometimes occur. If multiple same requests comes at the same time. All (same) requests
                     # are put to srv input queue. Once first is finished all clients will use cached result instead of
                     # waiting for their result -> results will never be picked up. Result is lost because original
                     # request is not known at that point.
                     self.logger.debug(f"DatabaseManager: KeyError when trying to access request ID: "
-                                      f"{tmp_result[1][0]}, in _get_tmp_result")
+                                      f"{tmp_result[1]}, in _get_tmp_result")
                 continue
-            if tmp_result[1][0] == request_id:
-                if isinstance(tmp_result[1][1], list):
-                    for req, out in zip(request, tmp_result[1][1]):
-                        outputs.append(self._save_result(srv_id, req, out))
+            if tmp_result[1] == request_id:
+                if isinstance(tmp_result[2], list):
+                    for req, out in zip(request, tmp_result[2]):
+                        outputs.append(save_result(srv_id, req, out))
                 else:
-                    outputs.append(self._save_result(srv_id, request, tmp_result[1][1]))
+                    outputs.append(save_result(srv_id, request, tmp_result[2]))
                 break
             else:
                 tmp_result_list.append(tmp_result)
+        # Re-append in one call to the end (not front) -> next scan continues with results behind first TMP_ITER
+        tmp_q.extend(tmp_result_list)
         for res in tmp_result_list:
-            self.tmp_results[srv_id].put(res)
+            # Result may have been missed by its request while it was held here -> wake it up
+            event = result_events.get(res[1])
+            if event is not None:
+                event.set()
         if outputs:
-            self.logger.debug(f"DatabaseManager: Result for request: {request}, "
-                              f"service_id: {srv_id} found in tmp cache.")
-            if len(outputs) == 1:
-                return outputs[0]
-            else:
+            if self.logger.debug_enabled:
+                self.logger.debug(f"DatabaseManager: Result for request: {request}, "
+                                  f"service_id: {srv_id} found in tmp cache.")
+            if isinstance(request, list):
+                # List request returns list even for single request
                 return outputs
+            return outputs[0]
         return None
 
     def _save_result(self, srv_id: int, request: str, result: dict) -> dict:
         """Save service result to database. Add timestamp and delete least accessed result if database is full.
         Return timestamped result."""
         srv_dict = self.service_outputs[srv_id]
-        if len(srv_dict) >= self.config.max_database_size:
+        if request in srv_dict:
+            # Updated result becomes the most recently used, nothing has to be evicted
+            srv_dict.move_to_end(request)
+        elif len(srv_dict) >= self.config.max_database_size:
             srv_dict.popitem(last=False)
         new_result = {"timestamp": datetime.datetime.now(), "output": result}
-        srv_dict[request] = new_result
+        # Stored as (monotonic time, result) -> age check is a float subtraction, returned result keeps datetime
+        srv_dict[request] = (time.monotonic(), new_result)
         return new_result
 
     def _save_tmp_result(self, srv_id: int, result: tuple) -> None:
-        """Append result to service tmp queue."""
-        self.tmp_results[srv_id].put([0, result])
+        """Append result to service tmp queue. Deque append/popleft are atomic, request threads need no extra lock."""
+        self.tmp_results[srv_id].append([0, result[0], result[1]])
 
     @staticmethod
     def _parse_int(string_id: str) -> Union[int, None]:
-        """Try to convert str to int."""
+        """Try to convert str to int. Strings are checked before conversion because most group names are not numbers
+        and raising ValueError for every one of them is slow."""
+        if type(string_id) is int:
+            return string_id
+        if isinstance(string_id, str):
+            digits = string_id.strip()
+            if digits[:1] in ("+", "-"):
+                digits = digits[1:]
+            if digits.isdecimal():
+                return int(string_id)
+            return None
         try:
             return int(string_id)
         except ValueError:
@@ -303,13 +380,19 @@ class DatabaseManager:
         self.request_dicts[srv_id][req_id] = request
         return req_id
 
-    def _run_service_quick(self, srv_id: int, request: Union[str, list[str]]) -> Optional[int]:
+    def _run_service_quick(self, srv_id: int, request: Union[str, list[str]],
+                           event: Optional[th.Event] = None) -> Optional[int]:
         """Append request to service input queue directly. For internal purpose only.
-        Does not do request and srv_id validation!"""
+        Does not do request and srv_id validation! Event (if present) is set when result of the request is collected."""
         if not request:
             return None
         req_id = self.man.get_next_index()
+        if event is not None:
+            # Registered before the request is queued so that result cannot be collected before
+            self.result_events[srv_id][req_id] = event
         self.service_input_queues[srv_id].put((req_id, request))
+        # Both dicts are needed, ServiceManager deletes its entry once a worker finishes the request while
+        # DatabaseManager keeps it until the API request picks up the result (pending check, orphan results)
         self.man.request_dicts[srv_id][req_id] = request
         self.request_dicts[srv_id][req_id] = request
         return req_id
@@ -322,96 +405,81 @@ class DatabaseManager:
         self.gb_collector.start()
 
     def _stop_gb_collector(self) -> None:
-        """Stop/kill Garbage Collector thread."""
+        """Stop Garbage Collector thread. None wakes it up so that it checks initialized value and exits."""
         if self.gb_collector is None:
             return
         self.garbage_queue.put(None)
-        self.gb_collector.join(1)
+        self.gb_collector.join(self.config.th_proc_response_time * 2)
         if self.gb_collector.is_alive():
-            self.logger.warning(f"ServiceManager: Killing garbage collector")
-            self._kill_thread("db_gb_collector")
+            # Daemon thread, it will not block exit
+            self.logger.error(f"DatabaseManager: Garbage collector did not stop")
         self.gb_collector = None
 
-    def _kill_thread(self, thread_name: str) -> None:
-        """Forcefully kill thread."""
-        for thread in th.enumerate():
-            if thread.name == thread_name:
-                thread.join(self.config.th_proc_response_time)
-                if not thread.is_alive():
-                    return
-                self.logger.info(f"DatabaseManager: Killing thread: {thread}")
-                res = ctypes.pythonapi.PyThreadState_SetAsyncExc(thread.ident, ctypes.py_object(SystemExit))
-                if res > 1:
-                    ctypes.pythonapi.PyThreadState_SetAsyncExc(thread.ident, 0)
-                return
-
     def _gb_collector(self):
         """Thread for deleting processed requests. It will delete processed request. Also it will delete unprocessed
         request if they are pending for more then self.config.garbage_collector_timeout and are not pending in
          ServiceManager."""
         self.logger.debug("DatabaseManager: Garbage collector: started")
-        pending_requests = [[] for _ in self.services]  # List for every service
+        pending_requests = [set() for _ in self.services]  # Set of request IDs for every service
+        max_service_run_time = self.config.max_service_run_time
         # There is infinite loop because _gb_collector is daemon. It will exit if main thread exited.
         while self.initialized:
             try:
-                req = self.garbage_queue.get(timeout=self.config.max_service_run_time)
-                # req = (service_id, request_id)
+                req = self.garbage_queue.get(timeout=max_service_run_time)
+                # req = (service_id, request_id) or list of them
             except OSError:
                 self.logger.error(f"DatabaseManager: Error while trying to get from garbage queue.")
                 time.sleep(1)
                 continue
             except _queue.Empty:
                 # Delete request which are still pending and not pending in ServiceManager
-                for srv_id, pending_request_list in enumerate(pending_requests):
+                for srv_id, pending_request_set in enumerate(pending_requests):
                     to_delete = []
-                    for pending_request_id in self.request_dicts[srv_id].keys():
+                    # Requests pending since previous sweep (set intersection with dict keys view is done in C)
+                    for pending_request_id in self.request_dicts[srv_id].keys() & pending_request_set:
                         # Delete request if it is pending for too long AND is not pending in ServiceManager
-                        if pending_request_id in pending_request_list and\
-                                self.man.is_pending(srv_id, pending_request_id) is False:
+                        if self.man.is_pending(srv_id, pending_request_id) is False:
                             # This should never happen
                             to_delete.append(pending_request_id)
                     for req_id in to_delete:
-                        try:
-                            del self.request_dicts[srv_id][req_id]
-                        except KeyError:
+                        self.result_events[srv_id].pop(req_id, None)
+                        # Requests are never None -> None means missing key
+                        if self.request_dicts[srv_id].pop(req_id, None) is None:
                             # This should never happen
                             self.logger.error(f"DatabaseManager: Key error when trying to delete pending "
                                               f"request ID: {req_id} of a service: {srv_id}.")
                         self.logger.warning(f"DatabaseManager: Request with ID: {req_id} was deleted because "
                                             f"it was not picked up for more then "
-                                            f"{self.config.max_service_run_time} seconds")
+                                            f"{max_service_run_time} seconds")
                 # Search for new pending requests
                 for d_id, d in enumerate(self.request_dicts):
-                    pending_requests[d_id].clear()
-                    for req_id in d.keys():
-                        pending_requests[d_id].append(req_id)
+                    pending_requests[d_id] = set(d)
                 continue  # continue while
 
             if req is None:
                 continue
-            if req[1] is None:
-                continue
-            try:
-                self.logger.debug(f"DatabaseManager: Garbage collector: removing finished "
-                                  f"request ID: {req[1]} of service: {req[0]}")
-                del self.request_dicts[req[0]][req[1]]
-            except KeyError:
-                # This can happen (request processed by ServiceManager but result never picked up).
-                # Or just invalid request ID
-                self.logger.warning(f"DatabaseManager: Key error when trying to delete "
-                                    f"request ID: {req[1]} of a service: {req[0]}. Ignoring.")
+            for srv_id, req_id in (req if isinstance(req, list) else (req,)):
+                if req_id is None:
+                    continue
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"DatabaseManager: Garbage collector: removing finished "
+                                      f"request ID: {req_id} of service: {srv_id}")
+                self.result_events[srv_id].pop(req_id, None)
+                if self.request_dicts[srv_id].pop(req_id, None) is None:
+                    # This can happen (request processed by ServiceManager but result never picked up).
+                    # Or just invalid request ID
+                    self.logger.warning(f"DatabaseManager: Key error when trying to delete "
+                                        f"request ID: {req_id} of a service: {srv_id}. Ignoring.")
 
         self.logger.debug("DatabaseManager: Garbage collector: died")
 
     def is_pending(self, service_id: int, request_id: int) -> bool:
-        if request_id in self.request_dicts[service_id]:
-            return True
-        return False
+        return request_id in self.request_dicts[service_id]
 
     def reload_tokens(self) -> bool:
         """This will reload tokens file in runtime. It will overwrite running tokens with saved tokens."""
         try:
-            new_aman = utility.AuthManager(file_tokens=os.path.normpath(self.config.tokens_path),
+            new_aman = utility.AuthManager(file_tokens=self.tokens_path,
                                            token_regex=self.config.token_regex,
                                            bypass_user=self.config.bypass_user_auth,
                                            bypass_admin=self.config.bypass_admin_auth)
@@ -425,32 +493,12 @@ class DatabaseManager:
 
     def database_to_dict(self):
         """Returns dict with lengths of all queues and database."""
-        output = {}
-
-        input_queues_sizes = []
-        for input_queue_index, input_queue in enumerate(self.service_input_queues):
-            input_queues_sizes.append({input_queue_index: input_queue.qsize()})
-        output["service_input_queues"] = input_queues_sizes
-
-        output_queues_sizes = []
-        for output_queue_index, output_queue in enumerate(self.service_output_queues):
-            output_queues_sizes.append({output_queue_index: output_queue.qsize()})
-        output["service_output_queues"] = output_queues_sizes
-
-        tmp_queues_sizes = []
-        for tmp_queues_index, tmp_queues in enumerate(self.tmp_results):
-            tmp_queues_sizes.append({tmp_queues_index: tmp_queues.qsize()})
-        output["tmp_queues"] = tmp_queues_sizes
-
-        service_outputs_sizes = []
-        for service_outputs_index, service_outputs in enumerate(self.service_outputs):
-            service_outputs_sizes.append({service_outputs_index: len(service_outputs)})
-        output["service_outputs"] = service_outputs_sizes
-        requests_dicts_sizes = []
-        for requests_dict_index, requests_dict in enumerate(self.request_dicts):
-            requests_dicts_sizes.append({requests_dict_index: len(requests_dict)})
-        output["pending"] = requests_dicts_sizes
-        return output
+        # {service_id: size, ...} for every category
+        return {"service_input_queues": {i: q.qsize() for i, q in enumerate(self.service_input_queues)},
+                "service_output_queues": {i: q.qsize() for i, q in enumerate(self.service_output_queues)},
+                "tmp_queues": {i: len(q) for i, q in enumerate(self.tmp_results)},
+                "service_outputs": {i: len(d) for i, d in enumerate(self.service_outputs)},
+                "pending": {i: len(d) for i, d in enumerate(self.request_dicts)}}
 
     def server_info(self) -> dict:
         """Returns running info, static info, database stats. Does not require token."""
@@ -470,6 +518,21 @@ class DatabaseManager:
         """Returns list of tuples with available groups. Does not require token."""
         return self.man.get_groups()
 
+    def log_cached_info(self, token: str, method: str) -> None:
+        """Log the same access line as info method (get_services_info, get_services_info_more, get_groups_info,
+        get_server_version) would log. Used when API answers from its response cache without calling the method."""
+        if method == "get_services_info":
+            self.logger.info(f"{token}: get_services_info: Services requested")
+        elif method == "get_services_info_more":
+            self.logger.info(f"{token}: get_services_info_more: Services requested")
+        elif method == "get_groups_info":
+            self.logger.info(f"{token}: get_groups_info: Groups requested")
+        elif method == "get_server_version":
+            if not self.aman.exist(token):
+                self.logger.info(f"{token}: get_server_version: Insufficient permissions")
+            else:
+                self.logger.info(f"{token}: get_server_version: Version requested")
+
     # ============================================= API endpoints ======================================================
     def get_services_info(self, token: str) -> dict:
         """API Admin and User endpoint: Get dictionary of available services
@@ -482,19 +545,17 @@ class DatabaseManager:
                   (dict): Dictionary of services {srv1_id: srv1_name, srv2_id: srv2_name, ...}
         """
         self.logger.info(f"{token}: get_services_info: Services requested")
-        if self.aman.authorize_admin(token) is True or self.aman.authorize_superuser(token) is True:
+        if self.aman.role_of(token) >= utility.ROLE_SUPERUSER:
             # Admin -> return everything -> keep on mind that admin may not have permissions to access these services
             # Only Users/Superusers can access services -> If you want admin to run services add him to Users/Superusers
-            return dict([(key, value) for key, value in self.man.get_services()])
+            return dict(self.man.get_services())
         # Token belongs to User or invalid
         # Empty dict {} will be return if 0 authorized services found
-        output = {}
         service_list = self.man.get_services()
         # Service_list -> [(srv1_id, srv1_name), (), ...]
-        for srv in service_list:
-            if self.aman.authorize_user(token, srv[0]):
-                output[srv[0]] = srv[1]
-        return output
+        # Token is validated once for all services
+        authorized_services = set(self.aman.get_user_authorized(token, [srv_id for srv_id, _ in service_list]))
+        return {srv_id: srv_name for srv_id, srv_name in service_list if srv_id in authorized_services}
 
     def get_services_info_more(self, token: str) -> dict:
         """API Admin and User endpoint: Get dictionary of available services with additional info
@@ -507,19 +568,18 @@ class DatabaseManager:
                   (dict): Dictionary of services {srv_id: [srv_name, srv_description, srv_groups], ...}
         """
         self.logger.info(f"{token}: get_services_info_more: Services requested")
-        if self.aman.authorize_admin(token) is True or self.aman.authorize_superuser(token) is True:
+        if self.aman.role_of(token) >= utility.ROLE_SUPERUSER:
             # Admin -> return everything -> keep on mind that admin may not have permissions to access these services
             # Only Users/Superusers can access services -> If you want admin to run services add him to Users/Superusers
-            return dict([(srv[0], [srv[1], srv[2], srv[3]]) for srv in self.man.get_services_more()])
+            return {srv_id: [name, description, groups]
+                    for srv_id, name, description, groups in self.man.get_services_more()}
         # Token belongs to User or invalid
         # Empty dict {} will be return if 0 authorized services found
-        output = {}
         service_list = self.man.get_services_more()
         # Service_list -> [(srv1_id, srv1_name, srv_description, srv_groups), (), ...]
-        for srv in service_list:
-            if self.aman.authorize_user(token, srv[0]):
-                output[srv[0]] = [srv[1], srv[2], srv[3]]
-        return output
+        authorized_services = set(self.aman.get_user_authorized(token, [srv[0] for srv in service_list]))
+        return {srv_id: [name, description, groups]
+                for srv_id, name, description, groups in service_list if srv_id in authorized_services}
 
     def get_groups_info(self, token: str) -> dict:
         """API Admin and User endpoint: Get dict of groups.
@@ -532,21 +592,15 @@ class DatabaseManager:
            (dict): Dictionary of groups and services {group_name1: [srv1, srv2], group_name2: [srv3], ...}
         """
         self.logger.info(f"{token}: get_groups_info: Groups requested")
-        if self.aman.authorize_admin(token) is True or self.aman.authorize_superuser(token) is True:
+        if self.aman.role_of(token) >= utility.ROLE_SUPERUSER:
             # Admin -> same as get_services_info, admin has only "read" permissions
-            return dict([(key, value) for key, value in self.man.get_groups()])
-        authorized_groups = {}
-        for key, value in self.man.get_groups():
-            # key -> group_name, value -> [srv1, srv2, ...]
-            authorized_services = []
-            for srv in value:
-                # srv -> (srv_id, srv_name)
-                if self.aman.authorize_user(token, srv[0]):
-                    authorized_services.append(srv)
-            # Append group name only if authorized services are not empty
-            if len(authorized_services) > 0:
-                authorized_groups[key] = authorized_services
-        return authorized_groups
+            return dict(self.man.get_groups())
+        authorized_ids = set(self.aman.get_user_authorized(token, [srv[0] for srv in self.services]))
+        # group_name -> [srv1, srv2, ...], srv -> (srv_id, srv_name)
+        authorized_groups = {key: [srv for srv in value if srv[0] in authorized_ids]
+                             for key, value in self.man.get_groups()}
+        # Keep group name only if authorized services are not empty
+        return {key: value for key, value in authorized_groups.items() if value}
 
     def get_tokens_info(self, token: str) -> dict:
         """API Admin endpoint: Get dict of tokens.
@@ -557,7 +611,7 @@ class DatabaseManager:
        Returns:
            (dict): Dictionary of running configuration of tokens.
        """
-        if self.aman.authorize_admin(token) is False:
+        if not self.aman.authorize_admin(token):
             self.logger.info(f"{token}: get_tokens_info: Insufficient permissions")
             return {"server": "Insufficient permissions"}
         self.logger.info(f"{token}: get_tokens_info: Tokens requested")
@@ -572,7 +626,7 @@ class DatabaseManager:
        Returns:
            (dict): Dictionary with static info, running info, database info.
        """
-        if self.aman.authorize_admin(token) is False:
+        if not self.aman.authorize_admin(token):
             self.logger.info(f"{token}: get_server_info: Insufficient permissions")
             return {"server": "Insufficient permissions"}
         self.logger.info(f"{token}: get_server_info: Server info requested")
@@ -588,12 +642,13 @@ class DatabaseManager:
           (dict): Dictionary with current version.
        """
         # If token is either user/superuser/admin
-        if self.aman.exist(token) is False:
+        if not self.aman.exist(token):
             self.logger.info(f"{token}: get_server_version: Insufficient permissions")
             return {"server": "Insufficient permissions"}
         self.logger.info(f"{token}: get_server_version: Version requested")
         return self.server_version()
 
+    @config_endpoint("put_tokens")
     def put_tokens(self, new_tokens: dict, token: str) -> dict:
         """API Admin endpoint: Update/Add to tokens.
 
@@ -604,38 +659,36 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: put_tokens: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f"{token}: put_tokens: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
-        if all(new_tokens[key] == "" or new_tokens[key] == [] for key in [tok_key for tok_key in new_tokens]):
+        if all(not value for value in new_tokens.values()):  # Only "" and [] provided
             self.logger.info(f"{token}: put_tokens: Nothing provided")
             return {"server": "Nothing provided"}
         output = {"server": "OK"}
-        if new_tokens.get("group"):
-            if self.aman.add_group(new_tokens.get("group"), new_tokens.get("group_services")) is True:
+        group = new_tokens.get("group")
+        if group:
+            if self.aman.add_group(group, new_tokens.get("group_services", [])):
                 output["group"] = "Group successfully added"
             else:
                 output["server"] = "ERROR"
-                output["superuser"] = "Error in group addition. Group name cannot be a number " \
-                                      "and group services can contain only numbers (Service IDs)."
-        if new_tokens.get("user"):
-            if self.aman.add_user(new_tokens.get("user"), new_tokens.get("user_services")) is True:
+                output["group"] = "Error in group addition. Group name cannot be a number " \
+                                  "and group services can contain only numbers (Service IDs)."
+        user = new_tokens.get("user")
+        if user:
+            if self.aman.add_user(user, new_tokens.get("user_services", [])):
                 output["user"] = "User successfully added"
             else:
                 output["server"] = "ERROR"
                 output["user"] = "Error in user addition. Make sure that token has valid format and user services " \
                                  "contain only numbers (Service IDs) or existing groups."
-        if new_tokens.get("superuser"):
-            if self.aman.add_superuser(new_tokens.get("superuser")) is True:
-                output["group"] = "Superuser successfully added"
+        superuser = new_tokens.get("superuser")
+        if superuser:
+            if self.aman.add_superuser(superuser):
+                output["superuser"] = "Superuser successfully added"
             else:
                 output["server"] = "ERROR"
                 output["superuser"] = "Error in superuser addition. Make sure that token has valid format."
-        if new_tokens.get("admin"):
-            if self.aman.add_admin(new_tokens.get("admin")) is True:
+        admin = new_tokens.get("admin")
+        if admin:
+            if self.aman.add_admin(admin):
                 output["admin"] = "Admin successfully added"
             else:
                 output["server"] = "ERROR"
@@ -644,13 +697,13 @@ class DatabaseManager:
         if output["server"] == "ERROR":
             output["info"] = "Any changes in keys containing errors will not be saved."
 
-        difference = self.aman.get_config_diff(os.path.normpath(self.config.tokens_path))
+        difference = self.aman.get_config_diff(self.tokens_path)
         if len(difference) == 0:
             output["server"] = "ERROR"
             output["message"] = "Nothing was changed"
             return output
 
-        if self.aman.save_tokens(os.path.normpath(self.config.tokens_path), self.config.tokens_backups) is False:
+        if not self.aman.save_tokens(self.tokens_path, self.config.tokens_backups):
             output["server"] = "ERROR"
             output["message"] = "Error occurred while saving tokens. Any changes will be lost on reload."
             self.logger.error(f"{token}: put_tokens: Error while trying to save tokens")
@@ -658,6 +711,7 @@ class DatabaseManager:
         self.logger.info(f"{token}: put_tokens: Tokens edited")
         return output
 
+    @config_endpoint("del_tokens")
     def del_tokens(self, to_delete: dict, token: str) -> dict:
         """API Admin endpoint: Delete from tokens.
 
@@ -668,43 +722,41 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: del_tokens: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f"{token}: del_tokens: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
-        if all(to_delete[key] == "" or to_delete[key] == [] for key in [tok_key for tok_key in to_delete]):
+        if all(not value for value in to_delete.values()):  # Only "" and [] provided
             self.logger.info(f"{token}: del_tokens: Nothing provided")
             return {"server": "Nothing provided"}
         output = {"server": "OK"}
-        if to_delete.get("group"):
-            if self.aman.remove_group(to_delete.get("group")) is True:
+        group = to_delete.get("group")
+        if group:
+            if self.aman.remove_group(group):
                 output["group"] = "Group successfully removed"
             else:
                 output["server"] = "ERROR"
-                output["superuser"] = "Error in group removal. Make sure you are not trying to delete group which is " \
-                                      "assigned to a user. Remove group from the user/s first."
-        if to_delete.get("user"):
-            if self.aman.remove_user(to_delete.get("user")) is True:
+                output["group"] = "Error in group removal. Make sure you are not trying to delete group which is " \
+                                  "assigned to a user. Remove group from the user/s first."
+        user = to_delete.get("user")
+        if user:
+            if self.aman.remove_user(user):
                 output["user"] = "User successfully removed"
             else:
                 output["server"] = "ERROR"
                 output["user"] = "Error in user removal"
-        if to_delete.get("superuser"):
-            if self.aman.remove_superuser(to_delete.get("superuser")) is True:
-                output["group"] = "Superuser successfully removed"
+        superuser = to_delete.get("superuser")
+        if superuser:
+            if self.aman.remove_superuser(superuser):
+                output["superuser"] = "Superuser successfully removed"
             else:
                 output["server"] = "ERROR"
                 output["superuser"] = "Error in superuser removal"
-        if to_delete.get("admin"):
-            if self.aman.remove_admin(to_delete.get("admin")) is True:
+        admin = to_delete.get("admin")
+        if admin:
+            if self.aman.remove_admin(admin):
                 output["admin"] = "Admin successfully removed"
             else:
                 output["server"] = "ERROR"
                 output["admin"] = "Error in admin removal"
 
-        difference = self.aman.get_config_diff(os.path.normpath(self.config.tokens_path))
+        difference = self.aman.get_config_diff(self.tokens_path)
         if difference is None:
             self.logger.error(f"{token}: del_tokens: Error while reading tokens file")
             output["server"] = "ERROR"
@@ -715,13 +767,14 @@ class DatabaseManager:
             output["message"] = "Nothing was changed"
             return output
 
-        if not self.aman.save_tokens(os.path.normpath(self.config.tokens_path), self.config.tokens_backups):
+        if not self.aman.save_tokens(self.tokens_path, self.config.tokens_backups):
             output["server"] = "ERROR"
             output["message"] = "Error occurred while saving tokens. Any changes will be lost on reload."
         output["changes"] = difference
         self.logger.info(f"{token}: del_tokens: Tokens edited")
         return output
 
+    @config_endpoint("get_start")
     def get_start(self, token) -> dict:
         """API Admin endpoint: Start services (if they are not running).
 
@@ -731,12 +784,6 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: get_start: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f"{token}: get_start: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
         if self.start_services():
             self.logger.info(f"{token}: get_start: Services started")
             return {"server": "Services started"}
@@ -744,6 +791,7 @@ class DatabaseManager:
             self.logger.info(f"{token}: get_start: Services already running")
             return {"server": "Services already running"}
 
+    @config_endpoint("get_stop")
     def get_stop(self, token) -> dict:
         """API Admin endpoint: Stop services.
 
@@ -753,12 +801,6 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: get_stop: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f"{token}: get_stop: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
         if self.stop_services():
             self.logger.info(f"{token}: get_stop: Services stopped")
             return {"server": "Services stopped"}
@@ -766,6 +808,7 @@ class DatabaseManager:
             self.logger.info(f"{token}: get_stop: Services already stopped")
             return {"server": "Services already stopped"}
 
+    @config_endpoint("get_restart")
     def get_restart(self, token: str) -> dict:
         """API Admin endpoint: Restart services.
 
@@ -775,18 +818,13 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: get_restart: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f" {token}: get_restart: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
         if self.restart_services():
             self.logger.info(f"{token}: get_restart: Services restarted")
             return {"server": "Services restarted"}
         else:
             return {"server": "Cannot occur"}
 
+    @config_endpoint("get_reload_tokens")
     def get_reload_tokens(self, token: str) -> dict:
         """API Admin endpoint: Reload tokens file.
 
@@ -796,12 +834,6 @@ class DatabaseManager:
         Returns:
             (dict): Dictionary with status message.
         """
-        if self.aman.authorize_admin(token) is False:
-            self.logger.info(f"{token}: get_reload_tokens: Insufficient permissions")
-            return {"server": "Insufficient permissions"}
-        if self.config.disable_config_endpoints is True:
-            self.logger.warning(f"{token}: get_reload_tokens: Configuration via API is disabled")
-            return {"server": "Configuration via API is disabled"}
         if self.reload_tokens():
             self.logger.info(f"{token}: get_reload_tokens: Tokens reloaded")
             return {"server": "Tokens Successfully reloaded"}
@@ -824,48 +856,54 @@ class DatabaseManager:
         timer = utility.Timer()
         timer.start()
         error = {"server": {"state": "ERROR", "input": request, "service": service_id, "message": ""}}
-        if self.running is False:
+        if not self.running:
             self.logger.info(f"{token}: get_service: Server is not running "
                              f"service_id: {service_id} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service: Server is not running "
-                              f"service_id: {service_id} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Server is not running "
+                                  f"service_id: {service_id} caching: {caching} request: {request}")
             error["server"]["message"] = "Server is not running"
             return error
-        if self.man.validate_request(request) is False:
+        if not self.man.validate_request(request):
             self.logger.info(f"{token}: get_service: Request validation failed "
                              f"service_id: {service_id} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service: Request validation failed "
-                              f"service_id: {service_id} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Request validation failed "
+                                  f"service_id: {service_id} caching: {caching} request: {request}")
             error["server"]["message"] = "Request validation failed"
             return error
         service_id = self._parse_int(service_id)
         if service_id is None:
             self.logger.info(f"{token}: get_service: Invalid service ID "
                              f"service_id: {service_id} [{timer.stop():.2f}]")
-            self.logger.debug(f"{token}: get_service: Invalid service ID "
-                              f"service_id: {service_id} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Invalid service ID "
+                                  f"service_id: {service_id} caching: {caching} request: {request}")
             error["server"]["message"] = "service_id must be integer"
             return error
-        if not any(srv[0] == service_id for srv in self.services):
+        if service_id not in self.service_ids:
             self.logger.info(f"{token}: get_service: Invalid service ID "
                              f"service_id: {service_id} [{timer.stop():.2f}]")
-            self.logger.debug(f"{token}: get_service: Invalid service ID "
-                              f"service_id: {service_id} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Invalid service ID "
+                                  f"service_id: {service_id} caching: {caching} request: {request}")
             error["server"]["message"] = "Invalid service_id"
             return error
         # Authorize user
         if not self.aman.authorize_user(token, service_id):
             self.logger.info(f"{token}: get_service: Insufficient permissions "
                              f"service_id: {service_id} [{timer.stop():.2f}]")
-            self.logger.debug(f"{token}: get_service: Insufficient permissions "
-                              f"service_id: {service_id} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Insufficient permissions "
+                                  f"service_id: {service_id} caching: {caching} request: {request}")
             error["server"]["message"] = "Insufficient permissions"
             return error
         self.logger.info(f"{token}: get_service: Incoming request service_id: {service_id}")
-        self.logger.debug(f"{token}: get_service: Incoming request "
-                          f"service_id: {service_id} caching: {caching} request: {request}")
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_service: Incoming request "
+                              f"service_id: {service_id} caching: {caching} request: {request}")
 
-        srv = self.services[service_id]
+        srv = self.service_map[service_id]
         # Service ID => srv[0], Service name => srv[1]
         output_dict = {"server": {"state": "OK", "input": request, "service_id": srv[0], "service_name": srv[1]}}
         if caching:
@@ -873,17 +911,21 @@ class DatabaseManager:
         else:
             database_result = None
         if database_result:
-            output_dict[self.services[srv[0]][1]] = database_result
-            self.logger.debug(f"{token}: get_service: Request done time: {timer.stop():.2f} "
-                              f"service_id: {srv[0]} caching: {caching} request: {request}")
+            output_dict[srv[1]] = database_result
+            timer.stop()
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service: Request done time: {timer.last_time:.2f} "
+                                  f"service_id: {srv[0]} caching: {caching} request: {request}")
             output_dict["server"]["response"] = round(timer.last_time, 3)
             return output_dict
         else:
-            req_id = self._run_service_quick(srv[0], request)
+            result_event = th.Event()
+            req_id = self._run_service_quick(srv[0], request, result_event)
 
-        iter_count = 0
-        timeout_count = 0
+        wait_timeout = GET_TIMEOUT
+        next_check = time.monotonic() + GET_CHECK_INTERVAL
         while True:
+            result_event.clear()
             database_result = self._get_database_result(srv[0], request)  # Non-blocking
             if database_result:
                 output_dict[srv[1]] = database_result
@@ -894,20 +936,19 @@ class DatabaseManager:
                 output_dict[srv[1]] = tmp_result
                 break
 
-            srv_result = self._get_result(srv[0], req_id, request)  # Blocking
-            if srv_result:
-                output_dict[srv[1]] = srv_result
-                break
+            # Wait until collector gets the result (database results of other requests are checked every wait_timeout)
+            if not result_event.wait(wait_timeout):
+                # Nothing arrived -> back off, own results still wake this thread up immediately
+                wait_timeout = min(wait_timeout * 1.5, GET_TIMEOUT_MAX)
 
             # Periodically check if request is still being processed if not then exit
-            iter_count += 1
-            if iter_count >= GET_ITER:
-                # This will execute every circa GET_ITER*GET_TIMEOUT e.g. 200*0.01 = 2s
-                iter_count = 0
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + GET_CHECK_INTERVAL
                 keep_on = False
-                if self.is_pending(srv[0], req_id) is True:
+                if self.is_pending(srv[0], req_id):
                     keep_on = True
-                if keep_on is False:
+                if not keep_on:
                     output_dict["server"]["state"] = "ERROR"
                     output_dict["server"]["message"] = "Result is incomplete. " \
                                                        "Some service did not process request in time"
@@ -915,13 +956,11 @@ class DatabaseManager:
                                       f"longer pending request_id: {req_id} "
                                       f"service_id: {srv[0]} caching: {caching} request: {request}")
                     break
-                if timeout_count >= 30:
-                    time.sleep(0.5)  # Total wait time more then 30*2s = 60s
-                else:
-                    time.sleep(timeout_count * 1.5 * GET_TIMEOUT)  # Max 29*1.7*0.01 = 0.493 s
 
-        self.logger.debug(f"{token}: get_service: Request done time: {timer.stop():.2f} "
-                          f"service_id: {srv[0]} caching: {caching} request: {request}")
+        timer.stop()
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_service: Request done time: {timer.last_time:.2f} "
+                              f"service_id: {srv[0]} caching: {caching} request: {request}")
         self.garbage_queue.put((srv[0], req_id))
         output_dict["server"]["response"] = round(timer.last_time, 3)
         return output_dict
@@ -941,22 +980,24 @@ class DatabaseManager:
         timer = utility.Timer()
         timer.start()
         error = {"server": {"state": "ERROR", "input": request, "group": group_name, "message": ""}}
-        if self.running is False:
+        if not self.running:
             self.logger.info(f"{token}: get_group: Server is not running "
                              f"group: {group_name} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group: Server not running "
-                              f"group: {group_name} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group: Server not running "
+                                  f"group: {group_name} caching: {caching} request: {request}")
             error["server"]["message"] = "Server is not running"
             return error
         if self._parse_int(group_name) is not None:
             # Accept string numbers as service_id -> redirect to get_service
             timer.stop()
             return self.get_service(group_name, request, token, caching)
-        if self.man.validate_request(request) is False:
+        if not self.man.validate_request(request):
             self.logger.info(f"{token}: get_group: Request validation failed "
                              f"group: {group_name} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group: Request validation failed "
-                              f"group: {group_name} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group: Request validation failed "
+                                  f"group: {group_name} caching: {caching} request: {request}")
             error["server"]["message"] = "Request validation failed"
             return error
         # Includes group_name validation
@@ -964,105 +1005,91 @@ class DatabaseManager:
         if not group_services:
             self.logger.info(f"{token}: get_group: Invalid group name "
                              f"group: {group_name} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group: Invalid group name "
-                              f"group: {group_name} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group: Invalid group name "
+                                  f"group: {group_name} caching: {caching} request: {request}")
             error["server"]["message"] = f"Group name \'{group_name}\' is not implemented or is invalid"
             return error
         # Authorize user / Remove unauthorized services
-        authorized_services = self.aman.get_user_authorized(token, [srv[0] for srv in group_services])
+        authorized_services = set(self.aman.get_user_authorized(token, [srv[0] for srv in group_services]))
         group_services = [srv for srv in group_services if srv[0] in authorized_services]
         if not group_services:
             self.logger.info(f"{token}: get_group: Insufficient permissions "
                              f"group: {group_name} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group: Insufficient permissions "
-                              f"group: {group_name} caching: {caching} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group: Insufficient permissions "
+                                  f"group: {group_name} caching: {caching} request: {request}")
             error["server"]["message"] = "Insufficient permissions"
             return error
         self.logger.info(f"{token}: get_group: Incoming request group: {group_name}")
-        self.logger.debug(f"{token}: get_group: Incoming request "
-                          f"group: {group_name} caching: {caching} request: {request}")
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_group: Incoming request "
+                              f"group: {group_name} caching: {caching} request: {request}")
 
         output_dict = {"server": {"state": "OK", "input": request, "group": group_name,
                                   "service_ids": [srv[0] for srv in group_services],
                                   "service_names": [srv[1] for srv in group_services]}}
-        srv_done = []
+        pending_services = []  # Services still processing the request, shrinks as results arrive
         srv_map = {}  # Maps srv_id -> req_id
-        num_services = 0
-        num_done_services = 0
+        result_event = th.Event()  # Shared by all services of the group
         for srv in group_services:
             # Service ID => srv[0], Service name => srv[1]
-            num_services += 1
             if caching:
                 database_result = self._get_database_result(srv[0], request)
             else:
                 database_result = None
             if database_result:
                 output_dict[srv[1]] = database_result
-                srv_done.append(True)
-                num_done_services += 1
             else:
-                req_id = self._run_service_quick(srv[0], request)
+                req_id = self._run_service_quick(srv[0], request, result_event)
                 srv_map[srv[0]] = req_id
-                srv_done.append(False)
-
-        iter_count = 0
-        timeout_count = 0
-        while num_done_services < num_services:
-
-            for done_id, srv in enumerate(group_services):
+                pending_services.append(srv)
+
+        wait_timeout = GET_TIMEOUT
+        next_check = time.monotonic() + GET_CHECK_INTERVAL
+        while pending_services:
+            result_event.clear()
+            still_pending = []
+            for srv in pending_services:
                 # Service ID => srv[0], Service name => srv[1]
-                if srv_done[done_id] is True:
-                    continue
-
                 database_result = self._get_database_result(srv[0], request)  # Non-blocking
                 if database_result:
                     output_dict[srv[1]] = database_result
-                    srv_done[done_id] = True
-                    num_done_services += 1
-                    self.garbage_queue.put((srv[0], srv_map[srv[0]]))
                     continue
 
                 tmp_result = self._get_tmp_result(srv[0], srv_map[srv[0]], request)  # Non-blocking
                 if tmp_result:
                     output_dict[srv[1]] = tmp_result
-                    srv_done[done_id] = True
-                    num_done_services += 1
-                    self.garbage_queue.put((srv[0], srv_map[srv[0]]))
-                    continue
-
-                srv_result = self._get_result(srv[0], srv_map[srv[0]], request)  # Blocking
-                if srv_result:
-                    output_dict[srv[1]] = srv_result
-                    srv_done[done_id] = True
-                    num_done_services += 1
-                    self.garbage_queue.put((srv[0], srv_map[srv[0]]))
                     continue
+                still_pending.append(srv)
+            pending_services = still_pending
+            if not pending_services:
+                break
+            # Wait until collector gets result of any service
+            if not result_event.wait(wait_timeout):
+                # Nothing arrived -> back off, own results still wake this thread up immediately
+                wait_timeout = min(wait_timeout * 1.5, GET_TIMEOUT_MAX)
 
             # Periodically check if request is still being processed if not then exit
-            iter_count += 1
-            if iter_count >= GET_ITER:
-                # This will execute every circa GET_ITER*GET_TIMEOUT e.g. 200*0.01 = 2s
-                iter_count = 0
-                keep_on = False
-                for done_id, srv in enumerate(group_services):
-                    if srv_done[done_id] is True:
-                        continue
-                    if self.is_pending(srv[0], srv_map[srv[0]]) is True:
-                        keep_on = True
-                if keep_on is False:
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + GET_CHECK_INTERVAL
+                # Stops at first service that is still processing the request
+                keep_on = any(self.is_pending(srv[0], srv_map[srv[0]]) for srv in pending_services)
+                if not keep_on:
                     output_dict["server"]["state"] = "ERROR"
                     output_dict["server"]["message"] = "Result is incomplete. " \
                                                        "Some service did not process request in time"
                     self.logger.error(f"{token}: get_group: Request returned incomplete due to no longer pending "
                                       f"group: {group_name} caching: {caching} request: {request}")
                     break
-                if timeout_count >= 30:
-                    time.sleep(0.5)  # Total wait time more then 30*2s = 60s
-                else:
-                    time.sleep(timeout_count*1.5*GET_TIMEOUT)  # Max 29*1.7*0.01 = 0.493 s
+        if srv_map:
+            self.garbage_queue.put(list(srv_map.items()))  # All requests of the group at once
 
-        self.logger.debug(f"{token}: get_group: Request done time: {timer.stop():.2f} "
-                          f"group: {group_name} caching: {caching} request: {request}")
+        timer.stop()
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_group: Request done time: {timer.last_time:.2f} "
+                              f"group: {group_name} caching: {caching} request: {request}")
         output_dict["server"]["response"] = round(timer.last_time, 3)
         return output_dict
 
@@ -1082,96 +1109,104 @@ class DatabaseManager:
         timer = utility.Timer()
         timer.start()
         error = {"server": {"state": "ERROR", "input": requests, "service": service_id, "message": ""}}
-        if self.running is False:
+        if not self.running:
             self.logger.info(f"{token}: get_service_list: Server is not running "
                              f"service_id: {service_id} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service_list: Server is not running "
-                              f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service_list: Server is not running "
+                                  f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "Server is not running"
             return error
         service_id = self._parse_int(service_id)
         if service_id is None:
             self.logger.info(f"{token}: get_service_list: Invalid service ID "
                              f"service_id: {service_id} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service_list: Invalid service ID "
-                              f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service_list: Invalid service ID "
+                                  f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "service_id must be integer"
             return error
-        if not any(srv[0] == service_id for srv in self.services):
+        if service_id not in self.service_ids:
             self.logger.info(f"{token}: get_service_list: Invalid service ID "
                              f"service_id: {service_id} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service_list: Invalid service ID "
-                              f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service_list: Invalid service ID "
+                                  f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "Invalid service_id"
             return error
         # Authorize user
         if not self.aman.authorize_user(token, service_id):
             self.logger.info(f"{token}: get_service_list: Insufficient permissions "
                              f"service_id: {service_id} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_service_list: Insufficient permissions "
-                              f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_service_list: Insufficient permissions "
+                                  f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "Insufficient permissions"
             return error
         # Validate requests, deduplicate
         unique_requests = []  # List of unique requests from requests, subset of requests
-        dup_map = {}  # Mapping unique to duplicate requests
-        for request_index, request in enumerate(requests):
-            if self.man.validate_request(request) is False:
+        dup_map = []  # Index in unique_requests for every request
+        unique_map = {}  # Maps request -> index in unique_requests
+        validate_request = self.man.validate_request  # Bound once, called for every request
+        for request in requests:
+            if not validate_request(request):
                 self.logger.info(f"{token}: get_service_list: Request validation failed "
                                  f"service_id: {service_id} num_requests: {len(requests)} time: {timer.stop():.2f}")
-                self.logger.debug(f"{token}: get_service_list: Request validation failed "
-                                  f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"{token}: get_service_list: Request validation failed "
+                                      f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
                 error["server"]["message"] = "Request validation failed"
                 return error
-            if request not in unique_requests:
+            unique_index = unique_map.get(request)
+            if unique_index is None:
                 # Append unique request
+                unique_index = len(unique_requests)
+                unique_map[request] = unique_index
                 unique_requests.append(request)
-                dup_map[request_index] = len(unique_requests) - 1
-            else:
-                # Append index of duplicate request
-                dup_map[request_index] = unique_requests.index(request)
+            # Index of (first occurrence of) request in unique_requests
+            dup_map.append(unique_index)
         self.logger.info(f"DatabaseManager: {token}: get_service_list: Incoming request "
                          f"service_id: {service_id} num_requests: {len(requests)}")
-        self.logger.debug(f"DatabaseManager: {token}: get_service_list: Incoming request "
-                          f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
-        response = [None] * len(requests)  # List of responses, same length as requests
-        to_request = []  # Unique request not in database -> need to be run, to_request <= unique_request <= requests
-        unique_responses = []  # Same length as unique_request, contains responses (None if not present)
-        srv = self.services[service_id]
+        if self.logger.debug_enabled:
+            self.logger.debug(f"DatabaseManager: {token}: get_service_list: Incoming request "
+                              f"service_id: {service_id} num_requests: {len(requests)} requests: {requests}")
+        srv = self.service_map[service_id]
         # Service ID => srv[0], Service name => srv[1]
-        for unique_request_id, unique_request in enumerate(unique_requests):
-            if caching:
-                unique_responses.append(self._get_database_result(srv[0], unique_request))
-            else:
-                unique_responses.append(None)
-            if unique_responses[unique_request_id] is None:
-                to_request.append(unique_request)
-        req_id = self._run_service_quick(srv[0], to_request)
+        # Same length as unique_request, contains responses (None if not present)
+        if caching:
+            unique_responses = self._get_database_results(srv[0], unique_requests)
+        else:
+            unique_responses = [None] * len(unique_requests)
+        # Unique request not in database -> need to be run, to_request <= unique_request <= requests
+        to_request = [unique_request for unique_request, unique_response in zip(unique_requests, unique_responses)
+                      if unique_response is None]
+        result_event = th.Event()
+        req_id = self._run_service_quick(srv[0], to_request, result_event)
         output_dict = {"server": {"state": "OK", "input": requests, "service_id": srv[0], "service_name": srv[1]}}
-        iter_count = 0
-        timeout_count = 0
+        wait_timeout = GET_TIMEOUT
+        next_check = time.monotonic() + GET_CHECK_INTERVAL
         results = []
         # Valid req_id is always > 0
         while req_id:
+            result_event.clear()
             tmp_result = self._get_tmp_result(srv[0], req_id, to_request)  # Non-blocking
             if tmp_result:
                 results = tmp_result
                 break
 
-            srv_result = self._get_result(srv[0], req_id, to_request)  # Blocking
-            if srv_result:
-                results = srv_result
-                break
+            # Wait until collector gets the result
+            if not result_event.wait(wait_timeout):
+                # Nothing arrived -> back off, own results still wake this thread up immediately
+                wait_timeout = min(wait_timeout * 1.5, GET_TIMEOUT_MAX)
 
             # Periodically check if request is still being processed if not then exit
-            iter_count += 1
-            if iter_count >= GET_ITER:
-                # This will execute every circa GET_ITER*GET_TIMEOUT e.g. 200*0.01 = 2s
-                iter_count = 0
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + GET_CHECK_INTERVAL
                 keep_on = False
-                if self.is_pending(srv[0], req_id) is True:
+                if self.is_pending(srv[0], req_id):
                     keep_on = True
-                if keep_on is False:
+                if not keep_on:
                     output_dict["server"]["state"] = "ERROR"
                     output_dict["server"]["message"] = "Results are incomplete. " \
                                                        "Some service did not process requests in time"
@@ -1179,28 +1214,22 @@ class DatabaseManager:
                                       f"longer pending request_id: {req_id} "
                                       f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
                     break
-                if timeout_count >= 30:
-                    time.sleep(0.5)  # Total wait time more then 30*2s = 60s
-                else:
-                    time.sleep(timeout_count*1.5*GET_TIMEOUT)  # Max 29*1.7*0.01 = 0.493 s
-        # Map results back to original (duplicate) requests/responses
-        db_counter = 0
-        for resp_id, _ in enumerate(response):
-            try:
-                if unique_responses[dup_map[resp_id]] is None:
-                    # Db result is None -> Therefore it must be in results at index db_counter
-                    # Copy result to unique_responses at index dup_map[resp_id]
-                    unique_responses[dup_map[resp_id]] = results[db_counter]
-                    db_counter += 1
-            except IndexError:
-                # Should never occur
-                self.logger.error(f"{token}: get_service_list: Index error while getting response request_id: {req_id} "
-                                  f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
-            response[resp_id] = unique_responses[dup_map[resp_id]]
-        output_dict[srv[1]] = response
-        self.logger.debug(f"{token}: get_service_list: Request done time: {timer.stop():.2f} "
-                          f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
-        self.garbage_queue.put((srv[0], req_id))
+        # Results are in order of to_request -> fill missing unique responses, then map back to original requests
+        missing = [unique_index for unique_index, unique_response in enumerate(unique_responses)
+                   if unique_response is None]
+        if len(results) < len(missing):
+            # Should never occur unless results are incomplete, missing responses stay None
+            self.logger.error(f"{token}: get_service_list: Missing results request_id: {req_id} "
+                              f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
+        for unique_index, result in zip(missing, results):
+            unique_responses[unique_index] = result
+        output_dict[srv[1]] = [unique_responses[unique_index] for unique_index in dup_map]
+        timer.stop()
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_service_list: Request done time: {timer.last_time:.2f} "
+                              f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
+        if req_id:
+            self.garbage_queue.put((srv[0], req_id))
         output_dict["server"]["response"] = round(timer.last_time, 3)
         return output_dict
 
@@ -1220,11 +1249,12 @@ class DatabaseManager:
         timer = utility.Timer()
         timer.start()
         error = {"server": {"state": "ERROR", "input": requests, "group": group_name, "message": ""}}
-        if self.running is False:
+        if not self.running:
             self.logger.info(f"{token}: get_group_list: Server is not running "
                              f"group: {group_name} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group_list: Server is not running "
-                              f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group_list: Server is not running "
+                                  f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "Server is not running"
             return error
         if self._parse_int(group_name) is not None:
@@ -1235,137 +1265,125 @@ class DatabaseManager:
         if not group_services:
             self.logger.info(f"{token}: get_group_list: Invalid group name "
                              f"group: {group_name} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group_list: Invalid group name "
-                              f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group_list: Invalid group name "
+                                  f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = f"Group name \'{group_name}\' is not implemented or is invalid"
             return error
         # Authorize user / Remove unauthorized services
-        authorized_services = self.aman.get_user_authorized(token, [srv[0] for srv in group_services])
+        authorized_services = set(self.aman.get_user_authorized(token, [srv[0] for srv in group_services]))
         group_services = [srv for srv in group_services if srv[0] in authorized_services]
         if not group_services:
             self.logger.info(f"{token}: get_group_list: Insufficient permissions "
                              f"group: {group_name} num_requests: {len(requests)} time: {timer.stop():.2f}")
-            self.logger.debug(f"{token}: get_group_list: Insufficient permissions "
-                              f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"{token}: get_group_list: Insufficient permissions "
+                                  f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
             error["server"]["message"] = "Insufficient permissions"
             return error
         # Validate requests, deduplicate
         unique_requests = []  # List of unique requests from requests, subset of requests
-        response = [[None] * len(requests) for _ in group_services]  # List of responses, same length as requests
-        dup_map = {}  # Mapping unique to duplicate request
-        for request_index, request in enumerate(requests):
-            if self.man.validate_request(request) is False:
+        dup_map = []  # Index in unique_requests for every request
+        unique_map = {}  # Maps request -> index in unique_requests
+        validate_request = self.man.validate_request  # Bound once, called for every request
+        for request in requests:
+            if not validate_request(request):
                 self.logger.info(f"{token}: get_group_list: Request validation failed "
                                  f"group: {group_name} num_requests: {len(requests)} time: {timer.stop():.2f}")
-                self.logger.debug(f"{token}: get_group_list: Request validation failed "
-                                  f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"{token}: get_group_list: Request validation failed "
+                                      f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
                 error["server"]["message"] = "Request validation failed"
                 return error
-            if request not in unique_requests:
+            unique_index = unique_map.get(request)
+            if unique_index is None:
                 # Append unique request
+                unique_index = len(unique_requests)
+                unique_map[request] = unique_index
                 unique_requests.append(request)
-                dup_map[request_index] = len(unique_requests) - 1
-            else:
-                # Append index of duplicate request
-                dup_map[request_index] = unique_requests.index(request)
+            # Index of (first occurrence of) request in unique_requests
+            dup_map.append(unique_index)
         self.logger.info(f"{token}: get_group_list: Incoming request "
                          f"group: {group_name} num_requests: {len(requests)}")
-        self.logger.debug(f"{token}: get_group_list: Incoming request "
-                          f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_group_list: Incoming request "
+                              f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
 
         output_dict = {"server": {"state": "OK", "input": requests, "group": group_name,
                                   "service_ids": [srv[0] for srv in group_services],
                                   "service_names": [srv[1] for srv in group_services]}}
-        srv_done = []
+        pending_ids = []  # Indexes of group_services still processing requests, shrinks as results arrive
         srv_map = {}  # Maps srv_id -> req_id
-        num_services = 0
-        num_done_services = 0
-        to_request = [[] for _ in group_services]  # Unique request not in database
-        unique_responses = [[] for _ in group_services]  # Same length as unique_request, contains responses
+        to_request = []  # Unique request not in database for every service
+        unique_responses = []  # Same length as unique_request, contains responses for every service
+        result_event = th.Event()  # Shared by all services of the group
         for done_id, srv in enumerate(group_services):
             # Service ID => srv[0], Service name => srv[1]
-            for unique_request_id, unique_request in enumerate(unique_requests):
-                if caching:
-                    unique_responses[done_id].append(self._get_database_result(srv[0], unique_request))
-                else:
-                    unique_responses[done_id].append(None)
-                if unique_responses[done_id][unique_request_id] is None:
-                    to_request[done_id].append(unique_request)
-            num_services += 1
-            req_id = self._run_service_quick(srv[0], to_request[done_id])
+            if caching:
+                unique_responses.append(self._get_database_results(srv[0], unique_requests))
+            else:
+                unique_responses.append([None] * len(unique_requests))
+            to_request.append([unique_request for unique_request, unique_response
+                               in zip(unique_requests, unique_responses[done_id]) if unique_response is None])
+            req_id = self._run_service_quick(srv[0], to_request[done_id], result_event)
             if not req_id:
-                srv_done.append(True)
-                num_done_services += 1
                 continue
             srv_map[srv[0]] = req_id
-            srv_done.append(False)
+            pending_ids.append(done_id)
 
-        iter_count = 0
-        timeout_count = 0
+        wait_timeout = GET_TIMEOUT
+        next_check = time.monotonic() + GET_CHECK_INTERVAL
         results = [[] for _ in group_services]
-        while num_done_services < num_services:
-
-            for done_id, srv in enumerate(group_services):
+        while pending_ids:
+            result_event.clear()
+            still_pending = []
+            for done_id in pending_ids:
+                srv = group_services[done_id]
                 # Service ID => srv[0], Service name => srv[1]
-                if srv_done[done_id] is True:
-                    continue
-
                 tmp_result = self._get_tmp_result(srv[0], srv_map[srv[0]], to_request[done_id])  # Non-blocking
                 if tmp_result:
                     results[done_id] = tmp_result
-                    srv_done[done_id] = True
-                    num_done_services += 1
-                    continue
-
-                srv_result = self._get_result(srv[0], srv_map[srv[0]], to_request[done_id])  # Blocking
-                if srv_result:
-                    results[done_id] = srv_result
-                    srv_done[done_id] = True
-                    num_done_services += 1
                     continue
+                still_pending.append(done_id)
+            pending_ids = still_pending
+            if not pending_ids:
+                break
+            # Wait until collector gets result of any service
+            if not result_event.wait(wait_timeout):
+                # Nothing arrived -> back off, own results still wake this thread up immediately
+                wait_timeout = min(wait_timeout * 1.5, GET_TIMEOUT_MAX)
 
             # Periodically check if request is still being processed if not then exit
-            iter_count += 1
-            if iter_count >= GET_ITER:
-                # This will execute every circa GET_ITER*GET_TIMEOUT e.g. 200*0.01 = 2s
-                iter_count = 0
-                keep_on = False
-                for done_id, srv in enumerate(group_services):
-                    if srv_done[done_id] is True:
-                        continue
-                    if self.is_pending(srv[0], srv_map[srv[0]]) is True:
-                        keep_on = True
-                if keep_on is False:
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + GET_CHECK_INTERVAL
+                # Stops at first service that is still processing the request
+                keep_on = any(self.is_pending(group_services[done_id][0], srv_map[group_services[done_id][0]])
+                              for done_id in pending_ids)
+                if not keep_on:
                     output_dict["server"]["state"] = "ERROR"
                     output_dict["server"]["message"] = "Results are incomplete. " \
                                                        "Some service did not process requests in time"
                     self.logger.error(f"{token}: get_group_list: Request returned incomplete due to no longer pending "
                                       f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
                     break
-                if timeout_count >= 30:
-                    time.sleep(0.5)  # Total wait time more then 30*2s = 60s
-                else:
-                    time.sleep(timeout_count*1.5*GET_TIMEOUT)  # Max 29*1.7*0.01 = 0.493 s
-        # Map results back to original (duplicate) requests/responses
+        # Results are in order of to_request -> fill missing unique responses, then map back to original requests
         for done_id, srv in enumerate(group_services):
-            db_counter = 0
-            for resp_id, _ in enumerate(response[done_id]):
-                try:
-                    if unique_responses[done_id][dup_map[resp_id]] is None:
-                        # Db result is None -> Therefore it must be in results at index db_counter
-                        # Copy result to unique_responses at index dup_map[resp_id]
-                        unique_responses[done_id][dup_map[resp_id]] = results[done_id][db_counter]
-                        db_counter += 1
-                except IndexError:
-                    # Should never occur
-                    self.logger.error(
-                        f"{token}: get_group_list: Index error while getting response resp_id: {resp_id} "
-                        f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
-                response[done_id][resp_id] = unique_responses[done_id][dup_map[resp_id]]
-            output_dict[srv[1]] = response[done_id]
-        for srv_id, req_id in srv_map.items():
-            self.garbage_queue.put((srv_id, req_id))
-        self.logger.debug(f"{token}: get_group_list: Request done time: {timer.stop():.2f} "
-                          f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
+            srv_responses = unique_responses[done_id]
+            missing = [unique_index for unique_index, unique_response in enumerate(srv_responses)
+                       if unique_response is None]
+            if len(results[done_id]) < len(missing):
+                # Should never occur unless results are incomplete, missing responses stay None
+                self.logger.error(f"{token}: get_group_list: Missing results "
+                                  f"service_id: {srv[0]} num_requests: {len(requests)} requests: {requests}")
+            for unique_index, result in zip(missing, results[done_id]):
+                srv_responses[unique_index] = result
+            output_dict[srv[1]] = [srv_responses[unique_index] for unique_index in dup_map]
+        if srv_map:
+            self.garbage_queue.put(list(srv_map.items()))  # All requests of the group at once
+        timer.stop()
+        if self.logger.debug_enabled:
+            self.logger.debug(f"{token}: get_group_list: Request done time: {timer.last_time:.2f} "
+                              f"group: {group_name} num_requests: {len(requests)} requests: {requests}")
         output_dict["server"]["response"] = round(timer.last_time, 3)
         return output_dict
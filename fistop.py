@@ -1,4 +1,4 @@
-# fistop.py requires packages: fastapi, uvicorn
+# fistop.py requires packages: fastapi, uvicorn, orjson
 import logging
 import os
 import sys
@@ -24,30 +24,33 @@ if __name__ == "__main__":
         # Validation is done later in both DatabaseManager and ServiceManager
         sys.path.insert(0, directory)
     # Set token types
-    api.ALLOW_HEADER_TOKEN = config.allow_header_token
-    api.ALLOW_PARAMETER_TOKEN = config.allow_parameter_token
-    api.ALLOW_COOKIE_TOKEN = config.allow_cookie_token
-    api.ALLOW_WEB_CLIENT = config.serve_web_client
-    # Create database object
-    api.db = database.DatabaseManager(config)
-    # Start uvicorn server
+    api.configure(config)
     if config.use_ssl is True:
         if not os.path.exists(os.path.normpath(config.ssl_key)) or \
                 not os.path.exists(os.path.normpath(config.ssl_cert)):
-            api.db.shutdown()
             raise utility.ConfigError(f"Cert file: {config.ssl_key} or {config.ssl_key} does not exist")
-        uvicorn.run(
-            api.app,
-            host=config.uvicorn_listen,
-            port=config.ssl_port,
-            log_level=logging.ERROR,
-            ssl_keyfile=os.path.normpath(config.ssl_key),
-            ssl_certfile=os.path.normpath(config.ssl_cert),
-            workers=config.uvicorn_workers)
+        ssl_options = {"port": config.ssl_port,
+                       "ssl_keyfile": os.path.normpath(config.ssl_key),
+                       "ssl_certfile": os.path.normpath(config.ssl_cert)}
+    else:
+        ssl_options = {"port": config.port}
+    # 0 workers means one worker per CPU
+    workers = config.uvicorn_workers if config.uvicorn_workers > 0 else os.cpu_count() or 1
+    if workers == 1:
+        # Create database object and register API endpoints
+        api.setup(database.DatabaseManager(config))
+        application = api.app
     else:
-        uvicorn.run(
-            api.app,
-            host=config.uvicorn_listen,
-            port=config.port,
-            log_level=logging.ERROR,
-            workers=config.uvicorn_workers)
+        # Every worker process creates its own DatabaseManager via api.app_factory
+        os.environ[api.CONFIG_ENV] = config_file
+        application = "api:app_factory"
+    # Start uvicorn server
+    uvicorn.run(
+        application,
+        factory=workers > 1,
+        host=config.uvicorn_listen,
+        log_level=logging.ERROR,
+        loop=config.uvicorn_loop,
+        http=config.uvicorn_http,
+        workers=workers,
+        **ssl_options)
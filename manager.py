@@ -66,7 +66,8 @@ class ServiceManager:
         self.srv_objects = []  # Instances of Service classes -> [Srv1(), Srv2(), ...]
         self.srv_immutables = []  # Immutable instances of Service classes -> [ImmutableService1(), ...]
         self.srv_names = []  # Names of services -> [srv1.name, srv2.name, ...]
-        self.helpers_running = mp.Value(ctypes.c_bool, False)
+        self.helpers_running = mp.RawValue(ctypes.c_bool, False)  # Written only by manager
+        self.terminator_wakeup = th.Event()  # Set on shutdown to interrupt terminator sleep
         self.max_request_size = self.config.max_message_size
         self.running = False
         self.initialized = False
@@ -134,7 +135,7 @@ class ServiceManager:
                 self.logger.error(f"ServiceManager: Some threads or processes seams to be running. Continuing anyway. "
                                   f"threads: {self.get_service_threads(srv_id)} "
                                   f"processes: {self.get_service_processes(srv_id)}")
-            self._change_mp_value(self.srv_running[srv_id], True)
+            self.srv_running[srv_id].value = True
             for th_id in range(srv.threads):
                 self._start_worker_th(srv_id, th_id, self.srv_running[srv_id], self.srv_states[srv_id][0][th_id],
                                       self.srv_values[srv_id][0][th_id], self.srv_awaiting[srv_id][0][th_id],
@@ -183,7 +184,8 @@ class ServiceManager:
             self.logger.stop_mp_logging()
         self.running = False
         self.initialized = False
-        self._change_mp_value(self.helpers_running, False)
+        self.helpers_running.value = False
+        self.terminator_wakeup.set()
         self.garbage_queue.put(None)
         self._kill_services()
         self._kill_terminator()
@@ -197,6 +199,8 @@ class ServiceManager:
             self.srv_queues[srv_id] = (None, None)
         self._destroy_mp_queue(self.garbage_queue)
         self.garbage_queue = None
+        if self.config.shared_logger is False:
+            self.logger.stop()  # Write remaining records
         return True
 
     def initialize(self):
@@ -220,28 +224,35 @@ class ServiceManager:
         self.request_dicts = [{} for _ in self.srv_immutables]
         self.garbage_queue = mp.Queue()
 
-        self._change_mp_value(self.helpers_running, True)
+        self.helpers_running.value = True
+        self.terminator_wakeup.clear()
 
         for srv_id, srv in enumerate(self.srv_immutables):
-            queues = (mp.Queue(), mp.Queue())  # (input_queue, output_queue)
+            if srv.processes == 0:
+                # Thread only service -> in-process queues, no pickling and no feeder thread per message
+                queues = (queue.Queue(), queue.Queue())  # (input_queue, output_queue)
+            else:
+                queues = (mp.Queue(), mp.Queue())  # (input_queue, output_queue)
             process_states, thread_states = [], []
             process_values, thread_values = [], []
             process_awaits, thread_awaits = [], []
             self.srv_timeout_counters.append(0)
-            self.srv_running.append(mp.Value(ctypes.c_bool, False))
+            # Shared values without lock (RawValue). Every value is a single word which is written as a whole and
+            # workers update them several times per request, lock would cost two semaphore calls per access.
+            self.srv_running.append(mp.RawValue(ctypes.c_bool, False))
 
             for th_id in range(srv.threads):
-                state = mp.Value(ctypes.c_bool, False)
-                awaiting = mp.Value(ctypes.c_bool, False)
-                value = mp.Value(ctypes.c_ulong)  # Initialize with 0
+                state = mp.RawValue(ctypes.c_bool, False)
+                awaiting = mp.RawValue(ctypes.c_bool, False)
+                value = mp.RawValue(ctypes.c_ulong)  # Initialize with 0
                 thread_states.append(state)
                 thread_values.append(value)
                 thread_awaits.append(awaiting)
 
             for proc_id in range(srv.processes):
-                state = mp.Value(ctypes.c_bool, False)
-                awaiting = mp.Value(ctypes.c_bool, False)
-                value = mp.Value(ctypes.c_ulong)  # Initialize with 0
+                state = mp.RawValue(ctypes.c_bool, False)
+                awaiting = mp.RawValue(ctypes.c_bool, False)
+                value = mp.RawValue(ctypes.c_ulong)  # Initialize with 0
                 process_states.append(state)
                 process_values.append(value)
                 process_awaits.append(awaiting)
@@ -336,7 +347,7 @@ class ServiceManager:
                                name=self._get_th_proc_name(srv_id, th_id),
                                args=(is_running, state, value, awaiting, srv_id, self.srv_objects[srv_id].run,
                                      self.srv_objects[srv_id].run_list, self.srv_immutables[srv_id].allow_run_list,
-                                     queues, self.logger.get_queue(), self.garbage_queue))
+                                     queues, self.logger.get_queue(), self.garbage_queue, self.logger.debug_enabled))
         new_thread.start()
 
     def _start_worker_proc(self, srv_id: int, proc_id: int, is_running: mp.Value, state: mp.Value,
@@ -346,7 +357,8 @@ class ServiceManager:
                                  name=self._get_th_proc_name(srv_id, proc_id),
                                  args=(is_running, state, value, awaiting, srv_id, self.srv_objects[srv_id].run,
                                        self.srv_objects[srv_id].run_list, self.srv_immutables[srv_id].allow_run_list,
-                                       queues, self.logger.get_queue(), self.garbage_queue))
+                                       queues, self.logger.get_queue(), self.garbage_queue,
+                                       self.logger.debug_enabled))
         new_process.start()
 
     def _start_terminator(self) -> None:
@@ -372,14 +384,9 @@ class ServiceManager:
     @staticmethod
     def _worker(is_running: mp.Value, state: mp.Value, value: mp.Array, awaiting: mp.Value, srv_id: int,
                 run: Callable[[str], dict], run_list: Callable[[list[str]], list[dict]], allow_list: bool,
-                queues: tuple, log_q: mp.Queue, gb_q: mp.Queue) -> None:
+                queues: tuple, log_q: mp.Queue, gb_q: mp.Queue, debug: bool) -> None:
         """Implementation of service worker thread/process.
         Allows thread/process timeout interruption and value recovery."""
-        def change_value(val: mp.Value, new_val: Union[bool, int]) -> None:
-            val.acquire()
-            val.value = new_val
-            val.release()
-
         def check_result(result: dict) -> dict:
             if not isinstance(result, dict):
                 raise Exception("Service did not return valid result.")
@@ -395,24 +402,23 @@ class ServiceManager:
         log_q.put(("DEBUG", f"Worker ({run.__self__.__class__}): started"))
         while is_running.value is True:
             if state.value is False:
-                change_value(state, True)
+                state.value = True
 
-            change_value(awaiting, True)
+            awaiting.value = True
             request = queues[0].get()
             if request is None:
                 # None is a signal to thread/process to check is_running value. It is crucial part of supervision.
                 continue
-            change_value(value, request[0])  # Request ID
-            change_value(awaiting, False)
+            value.value = request[0]  # Request ID
+            awaiting.value = False
 
             try:
                 if isinstance(request[1], list):
-                    if allow_list is True:
+                    if allow_list:
                         service_output = check_results(run_list(request[1]))
                     else:
-                        service_output = []
-                        for req in request[1]:
-                            service_output.append(check_result(run(req)))
+                        # Run every request, validate all outputs at once
+                        service_output = check_results(list(map(run, request[1])))
                     if len(request[1]) != len(service_output):
                         raise Exception("Length of input does not equal length of output. Output Discarded.")
                 else:
@@ -429,7 +435,7 @@ class ServiceManager:
                 try:
                     # This is sketchy
                     queues[1].put((request[0], service_output))
-                    change_value(value, 0)
+                    value.value = 0
                     gb_q.put((srv_id, request[0]))
                     log_q.put(("ERROR", f"Worker ({run.__self__.__class__}): "
                                         f"Thread/Process stopped during running, output processed anyway."))
@@ -439,9 +445,11 @@ class ServiceManager:
                                         f"Thread/Process stopped during running, output is lost."))
                 break
             queues[1].put((request[0], service_output))
-            change_value(value, 0)
+            value.value = 0
             gb_q.put((srv_id, request[0]))
-            log_q.put(("DEBUG", f"Worker ({run.__self__.__class__}): request: {request} result: {service_output}"))
+            if debug:
+                # Formatting and sending every result through the log queue is costly -> only when debug is enabled
+                log_q.put(("DEBUG", f"Worker ({run.__self__.__class__}): request: {request} result: {service_output}"))
         log_q.put(("DEBUG", f"Worker ({run.__self__.__class__}): died"))
 
     def _dummy_worker(self, queues: tuple, srv_id: int, gb_q: mp.Queue, message: str) -> None:
@@ -459,123 +467,93 @@ class ServiceManager:
                 service_output = output
             queues[1].put((request[0], service_output))
             gb_q.put((srv_id, request[0]))
-            self.logger.debug(f"Dummy worker (srv_id: {srv_id}): {request} -> {service_output}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"Dummy worker (srv_id: {srv_id}): {request} -> {service_output}")
         self.logger.debug(f"Dummy worker (srv_id: {srv_id}): died")
 
     def _terminator(self, running: mp.Value) -> None:
         """Implementation of terminator thread. Main purpose of this thread is to supervise worker thread. Monitor
         if workers are running properly if not than terminate them recover values and start new thread. If service
         thread/process timeouts more than Service.max_timeouts than whole service is terminated."""
-        time.sleep(self.config.th_proc_response_time)  # Delay for services to start
-        if all(srv.timeout == 0 for srv in self.srv_immutables):
+        self.terminator_wakeup.wait(self.config.th_proc_response_time)  # Delay for services to start
+        # Flat worker table of every supervised service (timeout != 0), built once so the loop below does one tuple
+        # unpack per worker instead of nested indexing -> [(srv_id, srv, [(is_process, th_proc_id, state, awaiting,
+        # value), ...], counters), ...]. Shared values are reused by restarted workers so references stay valid.
+        supervised = []
+        for srv_id, srv in enumerate(self.srv_immutables):
+            if srv.timeout == 0:
+                continue
+            workers = []
+            for is_process in (False, True):
+                for th_proc_id, (state, awaiting, value) in enumerate(zip(self.srv_states[srv_id][is_process],
+                                                                          self.srv_awaiting[srv_id][is_process],
+                                                                          self.srv_values[srv_id][is_process])):
+                    workers.append((is_process, th_proc_id, state, awaiting, value))
+            supervised.append((srv_id, srv, workers, [0] * len(workers)))
+        if not supervised:
             self.logger.debug("ServiceManager: Terminator: did not start because every service has timeout 0")
             return
 
-        # Create counters (Copy of self.service_states filled with zeroes)
-        counters = [[[], []] for _ in range(len(self.srv_states))]
-        for srv_id, srv in enumerate(self.srv_states):
-            for th_proc_id, th_proc in enumerate(srv):
-                for _ in th_proc:
-                    counters[srv_id][th_proc_id].append(0)
-
         self.logger.debug("ServiceManager: Terminator: started")
         while running.value is True:
             no_respond = False
-            for srv_id, srv_states, srv in zip(range(len(self.srv_immutables)), self.srv_states, self.srv_immutables):
-                # Skip services with timeout = 0
-                # if self.srv_simple[srv_id] is True:
-                #     continue
-                if self.srv_immutables[srv_id].timeout == 0:
-                    continue
+            for srv_id, srv, workers, counters in supervised:
                 # Skip not running services
-                if self.srv_running[srv_id].value is False:
+                if not self.srv_running[srv_id].value:
                     continue
                 stop_service = False
 
-                # Check thread states
-                for th_id, th_state in enumerate(srv_states[0]):
-                    if th_state.value:  # Thread responding normally
-                        counters[srv_id][0][th_id] = 0
-                        self._change_mp_value(th_state, False)
+                # Check thread and process states
+                for worker_idx, (is_process, th_proc_id, state, awaiting, value) in enumerate(workers):
+                    if state.value:  # Thread/process responding normally
+                        counters[worker_idx] = 0
+                        state.value = False
                         continue
-                    if self.srv_awaiting[srv_id][0][th_id].value is True:
-                        # Thread awaiting request
-                        counters[srv_id][0][th_id] = 0
+                    if awaiting.value:
+                        # Thread/process awaiting request
+                        counters[worker_idx] = 0
                         continue
-                    # Thread not responding (Stuck in service run method)
+                    # Thread/process not responding (Stuck in service run method)
                     no_respond = True
-                    counters[srv_id][0][th_id] += 1
-                    if counters[srv_id][0][th_id] < srv.timeout:  # No respond within timeout limit
+                    counters[worker_idx] += 1
+                    if counters[worker_idx] < srv.timeout:  # No respond within timeout limit
                         continue
+                    kind = "process" if is_process else "thread"
                     # If request is list -> extend timeout times number of requests
                     try:
-                        request_id = self.srv_values[srv_id][0][th_id]
-                        request = self.request_dicts[srv_id][int(request_id.value)]
+                        request = self.request_dicts[srv_id][int(value.value)]
                         if isinstance(request, list):
-                            if counters[srv_id][0][th_id] < srv.timeout * len(request):
+                            if counters[worker_idx] < srv.timeout * len(request):
                                 continue
                     except (KeyError, IndexError):
                         self.logger.warning(f"ServiceManager: Terminator: KeyError or IndexError when accessing value "
-                                            f"of service: {srv.name} thread: {srv_id}-{th_id}")
+                                            f"of service: {srv.name} {kind}: {srv_id}-{th_proc_id}")
                         # Request id does not exists -> Can theoretically happen
-                        # srv_value error -> Should not happen
                         # Proceed restarting thread/process
-                    # Thread not responding for srv.timeout seconds
+                    # Thread/process not responding for srv.timeout seconds
                     self.srv_timeout_counters[srv_id] += 1
                     if self.srv_timeout_counters[srv_id] >= srv.max_timeouts != 0:
                         # Service timeout too many times (srv.max_timeouts)
                         stop_service = True
                         break
-                    self.logger.warning(f"ServiceManager: Terminator: Restarting service: {srv.name} thread: "
-                                        f"{srv_id}-{th_id}, due to not responding for "
-                                        f"{counters[srv_id][0][th_id]} seconds")
-                    self._restart_thread(srv_id, th_id)
-
-                # Check process states
-                for proc_id, process_state in enumerate(srv_states[1]):
-                    if stop_service is True:
-                        break
-                    if process_state.value:
-                        counters[srv_id][1][proc_id] = 0
-                        self._change_mp_value(process_state, False)
-                        continue
-                    if self.srv_awaiting[srv_id][1][proc_id].value is True:
-                        # Process awaiting request
-                        counters[srv_id][1][proc_id] = 0
-                        continue
-                    no_respond = True
-                    counters[srv_id][1][proc_id] += 1
-                    if counters[srv_id][1][proc_id] < srv.timeout:
-                        continue
-                    # If request is list -> extend timeout times number of requests
-                    try:
-                        request_id = self.srv_values[srv_id][1][proc_id]
-                        request = self.request_dicts[srv_id][int(request_id.value)]
-                        if isinstance(request, list):
-                            if counters[srv_id][1][proc_id] < srv.timeout * len(request):
-                                continue
-                    except (KeyError, IndexError):
-                        self.logger.warning(f"ServiceManager: Terminator: KeyError or IndexError when accessing value "
-                                            f"of service: {srv.name} process: {srv_id}-{proc_id}")
-                        # Proceed restarting thread/process
-                    self.srv_timeout_counters[srv_id] += 1
-                    if self.srv_timeout_counters[srv_id] >= srv.max_timeouts != 0:
-                        stop_service = True
-                        break
-                    self.logger.warning(f"ServiceManager: Terminator: Restarting service: {srv.name} process: "
-                                        f"{srv_id}-{proc_id}, due to not responding for "
-                                        f"{counters[srv_id][1][proc_id]} seconds")
-                    self._restart_process(srv_id, proc_id)
+                    self.logger.warning(f"ServiceManager: Terminator: Restarting service: {srv.name} {kind}: "
+                                        f"{srv_id}-{th_proc_id}, due to not responding for "
+                                        f"{counters[worker_idx]} seconds")
+                    if is_process:
+                        self._restart_process(srv_id, th_proc_id)
+                    else:
+                        self._restart_thread(srv_id, th_proc_id)
 
                 if stop_service is True:
                     self.logger.error(f"ServiceManager: Terminator: Stopping service {srv.name} due to too many "
                                       f"timeouts. Starting dummy service.")
                     self._stop_running_service(srv_id, True, "Service stopped due to too many timeouts.")
 
+            # Event wait instead of sleep -> shutdown does not have to wait for the end of the cycle
             if no_respond is True:
-                time.sleep(1)  # 1 sec delay between terminator cycles (when not responding services detected)
+                self.terminator_wakeup.wait(1)  # 1 sec delay between cycles (when not responding services detected)
             else:
-                time.sleep(self.config.terminator_idle_cycle)  # Term. delay when nothing stuck
+                self.terminator_wakeup.wait(self.config.terminator_idle_cycle)  # Term. delay when nothing stuck
         self.logger.debug("ServiceManager: Terminator: died")
 
     def _gb_collector(self, running: mp.Value) -> None:
@@ -640,8 +618,9 @@ class ServiceManager:
             if req is None:
                 continue
             try:
-                self.logger.debug(f"ServiceManager: Garbage collector: removing finished "
-                                  f"request ID: {req[1]} of service: {req[0]}")
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"ServiceManager: Garbage collector: removing finished "
+                                      f"request ID: {req[1]} of service: {req[0]}")
                 del self.request_dicts[req[0]][req[1]]
             except KeyError:
                 # This can rarely happen (request was deleted from request_dicts due to garbage_collector_timeout then
@@ -651,19 +630,10 @@ class ServiceManager:
 
         self.logger.debug("ServiceManager: Garbage collector: died")
 
-    @staticmethod
-    def _change_mp_value(value: mp.Value, new_value: bool) -> None:
-        """Acquire and change multiprocessing.Value"""
-        value.acquire()
-        value.value = new_value
-        value.release()
-
     def _recover_value(self, srv_id: int, value: mp.Array) -> Union[str, list[str], None]:
         """Recover request from service thread/process that was stopped."""
-        value.acquire()
         res_id = value.value
         value.value = 0  # Reset value so it cannot be recovered again
-        value.release()
         if res_id == 0:
             return None
         try:
@@ -690,7 +660,7 @@ class ServiceManager:
     def _stop_running_service(self, srv_id: int, start_dummy: bool, message: str) -> None:
         """Signal service threads/processes to stop. Wait for response than forcefully kill remaining. """
         # Signal treads/processes to stop
-        self._change_mp_value(self.srv_running[srv_id], False)
+        self.srv_running[srv_id].value = False
 
         for _ in range(self.srv_immutables[srv_id].threads + self.srv_immutables[srv_id].processes + 1):
             self.srv_queues[srv_id][0].put(None)
@@ -811,13 +781,16 @@ class ServiceManager:
                                 self.srv_queues[srv_id])
 
     @staticmethod
-    def _destroy_mp_queue(q: mp.Queue) -> None:
+    def _destroy_mp_queue(q: Union[mp.Queue, queue.Queue]) -> None:
         try:
             while not q.empty():
                 q.get()
         except OSError:
             # Queue is already closed
             pass
+        if isinstance(q, queue.Queue):
+            # Thread only service queue
+            return
         q.close()
         q.cancel_join_thread()
         q.join_thread()
@@ -1035,11 +1008,13 @@ class ServiceManager:
                 (bool): True if request is valid.
         """
         if not isinstance(request, str):
-            self.logger.debug(f"ServiceManager: Request validation failed: not a string, request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Request validation failed: not a string, request: {request}")
             return False
         # benchmark needed: self.config.max_message_size vs self.max_request_size
         if len(request) > self.max_request_size:
-            self.logger.debug(f"ServiceManager: Request validation failed: request too big, request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Request validation failed: request too big, request: {request}")
             return False
         return True
 
@@ -1053,17 +1028,20 @@ class ServiceManager:
                 (bool): True if requests are valid.
         """
         if not isinstance(requests, list):
-            self.logger.debug(f"ServiceManager: Requests validation failed: not a list, requests: {requests}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Requests validation failed: not a list, requests: {requests}")
             return False
         for req in requests:
             # benchmark needed: self.config.max_message_size vs self.max_request_size
             if not isinstance(req, str):
-                self.logger.debug(f"ServiceManager: Request validation "
-                                  f"failed: not a string, request: {req} in requests: {requests}")
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"ServiceManager: Request validation "
+                                      f"failed: not a string, request: {req} in requests: {requests}")
                 return False
             if len(req) > self.max_request_size:
-                self.logger.debug(f"ServiceManager: Request validation "
-                                  f"failed: request too big, request: {req} in requests: {requests}")
+                if self.logger.debug_enabled:
+                    self.logger.debug(f"ServiceManager: Request validation "
+                                      f"failed: request too big, request: {req} in requests: {requests}")
                 return False
         return True
 
@@ -1106,8 +1084,9 @@ class ServiceManager:
             self.srv_queues[service_id][0].put((req_id, request))
             # Request is saved to request_dict after it is placed to srv input queue
             self.request_dicts[service_id][req_id] = request
-            self.logger.debug(f"ServiceManager: Running service: {self.srv_names[service_id]} "
-                              f"with request ID: {req_id} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Running service: {self.srv_names[service_id]} "
+                                  f"with request ID: {req_id} request: {request}")
             return req_id
         except AttributeError:
             self.logger.error(f"ServiceManager: Input queue for service: {self.srv_names[service_id]} no longer exists")
@@ -1135,8 +1114,9 @@ class ServiceManager:
             self.srv_queues[service_id][0].put((req_id, request_list))
             # Request is saved to request_dict after it is placed to srv input queue
             self.request_dicts[service_id][req_id] = request_list
-            self.logger.debug(f"ServiceManager: Running service: {self.srv_names[service_id]} "
-                              f"with request ID: {req_id} requests: {request_list}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Running service: {self.srv_names[service_id]} "
+                                  f"with request ID: {req_id} requests: {request_list}")
             return req_id
         except AttributeError:
             self.logger.error(f"ServiceManager: Input queue for service: {self.srv_names[service_id]} no longer exists")
@@ -1161,7 +1141,8 @@ class ServiceManager:
         # Put request directly to input queue (request ID must not change)
         try:
             self.srv_queues[service_id][0].put((orig_indexes[0], request))
-            self.logger.debug(f"ServiceManager: Rerunning request_id: {orig_indexes[0]} request: {request}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"ServiceManager: Rerunning request_id: {orig_indexes[0]} request: {request}")
         except AttributeError:
             # Input queue does not exist. Should never happen.
             self.logger.error(f"ServiceManager: Input queue for service: {self.srv_names[service_id]} does not exists."
@@ -1252,14 +1233,14 @@ class ServiceManager:
             return None
         return result
 
-    def get_service_output_queue(self, service_id: int) -> Union[mp.Queue, None]:
+    def get_service_output_queue(self, service_id: int) -> Union[mp.Queue, queue.Queue, None]:
         """Get service output queue. Direct access to service queue. Use with caution!
 
             Args:
                 service_id (int): ID of service which output queue should be returned.
 
             Returns:
-                (mp.Queue | None): Output queue (multiprocessing.Queue) of a service. Returns None if service_id validation failed queue does not exist.
+                (mp.Queue | queue.Queue | None): Output queue (queue.Queue for thread only services) of a service. Returns None if service_id validation failed queue does not exist.
         """
         if self.validate_service_id(service_id) is False:
             return None
@@ -1268,14 +1249,14 @@ class ServiceManager:
         except IndexError:
             return None
 
-    def get_service_input_queue(self, service_id: int) -> Union[mp.Queue, None]:
+    def get_service_input_queue(self, service_id: int) -> Union[mp.Queue, queue.Queue, None]:
         """Get service input queue. Direct access to service queue. Use with caution!
 
             Args:
                 service_id (int): ID of service which input queue should be returned.
 
             Returns:
-                (mp.Queue | None): Input queue (multiprocessing.Queue) of a service. Returns None if service_id validation failed queue does not exist.
+                (mp.Queue | queue.Queue | None): Input queue (queue.Queue for thread only services) of a service. Returns None if service_id validation failed queue does not exist.
         """
         if self.validate_service_id(service_id) is False:
             return None
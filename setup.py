@@ -15,5 +15,5 @@ setup(name='fistop',
       author_email='petrstovicek1@gmail.com',
       url='https://github.com/Stovka/fistop',
       python_requires='>=3.9',
-      install_requires=['fastapi~=0.85.1', 'uvicorn~=0.19.0'],
+      install_requires=['fastapi~=0.104.1', 'pydantic~=2.4', 'orjson~=3.9', 'uvicorn[standard]~=0.19.0'],
       )
@@ -1,10 +1,12 @@
 # utility.py requires Python3.9 standard library
+import atexit
 import configparser
 import ctypes
 import datetime
 import json
 import multiprocessing as mp
 import os
+import queue
 import re
 import sys
 import threading as th
@@ -94,11 +96,14 @@ class MPLogger:
         self.logger = logging.getLogger(name)
         self.queue = None
         self.thread = None
+        self.handler = None  # Handler writing records (stream/file/syslog), used by listener thread
+        self.listener = None
 
         allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if isinstance(level, str) and level.upper() not in allowed_levels:
             raise MPLoggerError(f"Logger: Invalid log level: {level}, allowed levels: {allowed_levels}")
         self.logger.setLevel(level.upper())
+        self.debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # Guard for costly debug messages
 
         if file_name and syslog_address:
             # both file_name and syslog_address != "" or None
@@ -147,6 +152,33 @@ class MPLogger:
                 self.debug(f"Logger: syslog logger: {name} with level: {level} initialized")
             except OSError:
                 raise MPLoggerError(f"Logger: error while trying to contact syslog server.")
+        # Handler was used directly above so that errors are raised here. From now on records are only put to queue
+        # by logging threads and written by listener thread (writing to stream/file/syslog does not block requests)
+        self.handler = handler
+        self.start()
+        atexit.register(self.stop)  # Fallback if shutdown was not called, writes remaining records
+
+    def start(self) -> None:
+        """Start listener thread which writes queued records. Does nothing if it is already running."""
+        if self.listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(log_queue, self.handler)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write remaining records and stop listener thread. Records logged afterwards are written directly."""
+        if self.listener is None:
+            return
+        listener = self.listener
+        self.listener = None
+        listener.stop()
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+                self.logger.removeHandler(handler)
+        self.logger.addHandler(self.handler)
 
     def debug(self, msg: str) -> None:
         self.logger.debug(msg)
@@ -188,6 +220,7 @@ class MPLogger:
         self.logger.debug("Logger: MP logging thread died.")
 
     def start_mp_logging(self) -> None:
+        self.start()  # Listener is stopped after shutdown
         self.stop_mp_logging()
         self.queue = mp.Queue()
         # Thread is daemon because it has to stop when main thread exited
@@ -228,6 +261,8 @@ class MPLogger:
 
 
 class Timer:
+    __slots__ = ("_start", "last_time")  # Created for every API request
+
     def __init__(self):
         self._start = None
         self.last_time = None
@@ -244,6 +279,13 @@ class AuthManagerError(Exception):
     pass
 
 
+# Token roles returned by AuthManager.role_of, higher role includes permissions of lower roles for listing endpoints
+ROLE_NONE: int = 0
+ROLE_USER: int = 1
+ROLE_SUPERUSER: int = 2
+ROLE_ADMIN: int = 3
+
+
 class AuthManager:
 
     def __init__(self, dict_tokens: Optional[dict] = None,
@@ -256,6 +298,10 @@ class AuthManager:
         self.groups = {}  # Dict of groups with services {"gr1" : [0, 1, 2]}
         self.users_mixed = {}  # Dict of user tokens containing service IDs and group names {"tok1" : [0, "gr1", 2]}
         self.users = {}  # Dict of user tokens with only service IDs {"tok1": [0, 1, 2]}
+        # Authorized services of tokens that were used {"tok1": (tokens_version, frozenset({0, 1, 2}))}, True means
+        # superuser. Entry is valid only if tokens_version matches, it is incremented on every user/superuser change
+        self.authorized_cache = {}
+        self.tokens_version = 0
         self.k_g = "groups"
         self.k_u = "users"
         self.k_s = "superusers"
@@ -271,7 +317,7 @@ class AuthManager:
             raise AuthManagerError(f"AuthManagerError: You can specify either dict_tokens or file_tokens not both.")
         # Validate token regex
         try:
-            re.compile(token_regex)
+            self.token_pattern = re.compile(token_regex)  # Compiled once, used on every request
             self.token_regex = token_regex
         except re.error:
             raise AuthManagerError(f"AuthManagerError: token_regex: {token_regex} is not valid regex")
@@ -368,12 +414,18 @@ class AuthManager:
                                            f"expected: int or str in {t_source}")
             self.users[usr_token] = [s for s in srv_ids]
         self.users_mixed = user_tokens[self.k_u]
+        # Copy of tokens as they are in tokens file, used by get_config_diff instead of parsing the file again
+        self.saved_path = None
+        self.saved_stat = None  # (st_mtime_ns, st_size) of tokens file when saved_tokens was taken
+        self.saved_tokens = None
+        if file_tokens is not None:
+            self._set_saved(file_tokens)
 
     def validate_token_format(self, token: str) -> bool:
         """Token validation. If is instance of str and match token_regex"""
         if not isinstance(token, str):
             return False
-        return bool(re.match(self.token_regex, token))
+        return self.token_pattern.match(token) is not None
 
     def _parse_file(self, path: str) -> dict:
         """Load tokens from file."""
@@ -490,19 +542,43 @@ class AuthManager:
                 del_dict[key] = value
         return add_dict, del_dict
 
-    def get_config_diff(self, path: str) -> Union[dict, None]:
-        """Computes difference between running config and given file. Returns changes keys/values. If there is error
-        while reading file it returns None"""
+    @staticmethod
+    def _file_stat(path: str) -> Union[tuple, None]:
         try:
-            # Initialize new instance of AuthManager with file tokens. Do not raise exception
-            saved_tokens = AuthManager(file_tokens=path)
-        except AuthManagerError:
+            st = os.stat(path)
+        except OSError:
             return None
+        return st.st_mtime_ns, st.st_size
+
+    def _set_saved(self, path: str, tokens: Optional["AuthManager"] = None) -> None:
+        """Remember content of tokens file at path. It is running config (after it was loaded or saved) or tokens
+        parsed from the file."""
+        if tokens is None:
+            tokens = self
+        self.saved_path = os.path.normpath(path)
+        self.saved_stat = self._file_stat(path)
+        self.saved_tokens = (list(tokens.superusers), list(tokens.admins),
+                             {k: list(v) for k, v in tokens.groups.items()},
+                             {k: list(v) for k, v in tokens.users.items()})
+
+    def get_config_diff(self, path: str) -> Union[dict, None]:
+        """Computes difference between running config and given file. Returns changes keys/values. If there is error
+        while reading file it returns None. File is read only if it was modified (mtime/size) since it was last
+        loaded, saved or read by this instance."""
+        if (self.saved_tokens is None or os.path.normpath(path) != self.saved_path
+                or self._file_stat(path) != self.saved_stat):
+            try:
+                # Initialize new instance of AuthManager with file tokens. Do not raise exception
+                saved_tokens = AuthManager(file_tokens=path)
+            except AuthManagerError:
+                return None
+            self._set_saved(path, saved_tokens)
+        saved_su, saved_a, saved_g, saved_u = self.saved_tokens
         difference = {}
-        su_add, su_del = self._get_delta_list(self.superusers, saved_tokens.superusers)
-        a_add, a_del = self._get_delta_list(self.admins, saved_tokens.admins)
-        g_add, g_del = self._get_delta_dict(self.groups, saved_tokens.groups)
-        u_add, u_del = self._get_delta_dict(self.users, saved_tokens.users)
+        su_add, su_del = self._get_delta_list(self.superusers, saved_su)
+        a_add, a_del = self._get_delta_list(self.admins, saved_a)
+        g_add, g_del = self._get_delta_dict(self.groups, saved_g)
+        u_add, u_del = self._get_delta_dict(self.users, saved_u)
 
         if len(su_add) > 0 or len(su_del) > 0:
             difference[self.k_s] = {}
@@ -536,6 +612,7 @@ class AuthManager:
                     f.write(file_tokens)
             except (PermissionError, FileNotFoundError):
                 return False
+            self._set_saved(path)
             return True
         backup_folder = "tokens_backups"
         backup_format_prefix = "%Y-%m-%d_%H-%M-%S"
@@ -563,7 +640,7 @@ class AuthManager:
         with open(path, "w+") as f:
             # Write tokens
             f.write(file_tokens)
-
+        self._set_saved(path)
         return True
 
     def get_ini_tokens(self) -> str:
@@ -634,6 +711,7 @@ class AuthManager:
             return False
         if token not in self.superusers:
             self.superusers.append(token)
+            self.tokens_version += 1
         return True
 
     def remove_superuser(self, token: str) -> bool:
@@ -643,6 +721,7 @@ class AuthManager:
         if token not in self.superusers:
             return False
         self.superusers.pop(self.superusers.index(token))
+        self.tokens_version += 1
         return True
 
     def add_group(self, group_name: str, group_services: list) -> bool:
@@ -725,6 +804,7 @@ class AuthManager:
 
         self.users_mixed[token] = new_group_services
         self.users[token] = [s_id for s_id in clean_s_ids]
+        self.tokens_version += 1
         return True
 
     def remove_user(self, token: str) -> bool:
@@ -732,6 +812,7 @@ class AuthManager:
         if token not in self.users:
             return False
         self.users.pop(token)
+        self.tokens_version += 1
         return True
 
     def exist(self, token: str) -> bool:
@@ -750,22 +831,34 @@ class AuthManager:
             return True
         return False
 
+    def _get_authorized(self, user_token: str) -> Union[frozenset, bool]:
+        """Returns frozenset of service IDs the token is authorized to, True for superuser and False if token is not
+        user nor superuser. Result is cached until users/superusers change. Only existing tokens are cached."""
+        cached = self.authorized_cache.get(user_token)
+        if cached is not None and cached[0] == self.tokens_version:
+            return cached[1]
+        tokens_version = self.tokens_version  # Before reading tokens -> concurrent change invalidates entry
+        if not self.validate_token_format(user_token):
+            return False
+        if user_token in self.superusers:
+            authorized = True
+        else:
+            user_services = self.users.get(user_token)
+            if user_services is None:
+                # Token does not exist
+                return False
+            authorized = frozenset(user_services)
+        self.authorized_cache[user_token] = (tokens_version, authorized)
+        return authorized
+
     def authorize_user(self, user_token: str, service_id: int) -> bool:
         """Check if token is authorized to service ID."""
         if self.bypass_user:
             return True  # Does not validate token format
-        if not self.validate_token_format(user_token):
-            return False
-        if user_token in self.superusers:
-            return True
-        user_services = self.users.get(user_token)
-        if user_services is None:
-            # Token does not exist
-            return False
-        if service_id not in user_services:
-            # Token exists but service_id not
-            return False
-        return True
+        authorized = self._get_authorized(user_token)
+        if isinstance(authorized, bool):
+            return authorized
+        return service_id in authorized
 
     def authorize_user_multiple(self, user_token: str, service_ids: list) -> bool:
         """Check if token is authorized all service IDs in list."""
@@ -785,18 +878,12 @@ class AuthManager:
         from provided list (service_ids)."""
         if self.bypass_user:
             return service_ids  # Does not validate token format
-        if not self.validate_token_format(user_token):
-            return []
-        if user_token in self.superusers:
+        authorized = self._get_authorized(user_token)
+        if authorized is True:
             return service_ids
-        user_services = self.users.get(user_token)
-        if user_services is None:
+        if authorized is False:
             return []
-        authorized = []
-        for srv_id in service_ids:
-            if srv_id in user_services:
-                authorized.append(srv_id)
-        return authorized
+        return [srv_id for srv_id in service_ids if srv_id in authorized]
 
     def authorize_admin(self, admin_token: str) -> bool:
         """Check if token exists in admin list."""
@@ -808,6 +895,21 @@ class AuthManager:
             return False
         return True
 
+    def role_of(self, token: str) -> int:
+        """Returns the highest role of token (ROLE_ADMIN, ROLE_SUPERUSER, ROLE_USER or ROLE_NONE).
+        Token format is validated only once."""
+        if self.bypass_admin:
+            return ROLE_ADMIN  # Does not validate token format
+        if not self.validate_token_format(token):
+            return ROLE_SUPERUSER if self.bypass_user else ROLE_NONE
+        if token in self.admins:
+            return ROLE_ADMIN
+        if self.bypass_user or token in self.superusers:
+            return ROLE_SUPERUSER
+        if token in self.users:
+            return ROLE_USER
+        return ROLE_NONE
+
     def authorize_superuser(self, user_token: str) -> bool:
         """Check if token exists in superuser list."""
         if self.bypass_user:
@@ -837,8 +939,10 @@ class Config:
     service_shutdown_timeout: float = 3.0  # Timeout for service shutdown() method.
     terminator_idle_cycle: float = 1.0  # Terminator sleep time between idle cycles. Should be 1 in the most scenarios.
     th_proc_response_time: float = 0.5  # Time for threads, processes to react.
-    uvicorn_workers: int = 1  # Number of processes for uvicorn HTTP server.
+    uvicorn_workers: int = 1  # Number of processes for uvicorn HTTP server. 0 means one process per CPU.
     uvicorn_listen: str = "0.0.0.0"  # IP On which should uvicorn listen.
+    uvicorn_loop: str = "auto"  # Event loop: auto (uvloop if installed), asyncio, uvloop.
+    uvicorn_http: str = "auto"  # HTTP protocol implementation: auto (httptools if installed), h11, httptools.
     include_dirs: list[str] = ["settings"]  # List of directories containing service definitions.
     services: list[str] = ["services"]  # List of modules (in included_dirs) with service definitions (services.py).
     tokens_path: str = "settings/tokens.ini"  # File containing tokens and tokens groups.
@@ -960,6 +1064,12 @@ class Config:
         if self.th_proc_response_time < 0.1 or self.th_proc_response_time > 10:
             raise ConfigError(f"Config: th_proc_response_time cannot be lower then 0.1 or greater then 10 "
                               f"in {c_source}")
+        if self.uvicorn_loop not in ("auto", "asyncio", "uvloop"):
+            raise ConfigError(f"Config: Invalid uvicorn_loop: {self.uvicorn_loop} options are: auto, asyncio, uvloop "
+                              f"in {c_source}")
+        if self.uvicorn_http not in ("auto", "h11", "httptools"):
+            raise ConfigError(f"Config: Invalid uvicorn_http: {self.uvicorn_http} options are: auto, h11, httptools "
+                              f"in {c_source}")
 
     def _parse_file(self, path: str) -> dict:
         """Load config from file as dictionary."""